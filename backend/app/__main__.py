@@ -0,0 +1,52 @@
+import os
+
+import uvicorn
+
+from app.core.config import Settings, settings
+
+
+def cpu_count() -> int:
+    # The CPUs this process may run on, which a container's cpuset can narrow
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(workers: int) -> int:
+    """
+    WORKERS=0 runs one worker per available core.
+    """
+    if workers < 0:
+        raise ValueError("WORKERS must be 0 (one per core) or a positive number")
+    return workers or cpu_count()
+
+
+def uvicorn_options(settings: Settings) -> dict:
+    """
+    The uvicorn.run() arguments for production serving, built from Settings.
+
+    The app is passed as an import string because every worker process
+    imports it itself, and each one gets its own connection pools.
+    """
+    return {
+        "app": "app.main:app",
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "workers": worker_count(settings.WORKERS),
+        "loop": settings.LOOP,
+        "http": settings.HTTP,
+        "backlog": settings.BACKLOG,
+        "timeout_keep_alive": settings.KEEP_ALIVE,
+        "limit_concurrency": settings.LIMIT_CONCURRENCY or None,
+        "limit_max_requests": settings.LIMIT_MAX_REQUESTS or None,
+        "timeout_graceful_shutdown": settings.TIMEOUT_GRACEFUL_SHUTDOWN,
+        "log_level": "debug" if settings.DEBUG else "info",
+    }
+
+
+def main() -> None:
+    uvicorn.run(**uvicorn_options(settings))
+
+
+if __name__ == "__main__":
+    main()
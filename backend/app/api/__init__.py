@@ -1,12 +1,17 @@
 from fastapi import APIRouter
-from app.api.endpoints import signup_user, login_user, view_all_users, view_current_user, update_user_data, delete_user_data, logout_user
+from app.api.endpoints import signup_user, login_user, view_all_users, export_users, view_current_user, update_user_data, delete_user_data, logout_user, logout_all_sessions, refresh_token, internal_stats, health
 
 api_router = APIRouter()
 
 api_router.include_router(signup_user.router)
 api_router.include_router(login_user.router)
 api_router.include_router(view_all_users.router)
+api_router.include_router(export_users.router)
 api_router.include_router(view_current_user.router)
 api_router.include_router(update_user_data.router)
 api_router.include_router(delete_user_data.router)
-api_router.include_router(logout_user.router)
\ No newline at end of file
+api_router.include_router(logout_user.router)
+api_router.include_router(logout_all_sessions.router)
+api_router.include_router(refresh_token.router)
+api_router.include_router(internal_stats.router)
+api_router.include_router(health.router)
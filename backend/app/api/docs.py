@@ -0,0 +1,129 @@
+import gzip
+import hashlib
+import json
+from typing import Optional
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+REDOC_URL = "/redoc"
+
+# The schema only changes on deploy; clients revalidate with the ETag after this
+CACHE_CONTROL = "public, max-age=300"
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows a gzip body.
+
+    An explicit gzip entry wins over "*", and a q-value of 0 is a refusal.
+    """
+    qualities = {}
+    for entry in accept_encoding.split(","):
+        coding, *params = entry.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.strip().lower()] = q
+
+    q = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return q > 0
+
+
+class PrecomputedAsset:
+    """
+    A response body encoded, gzipped and hashed once, then served as bytes.
+    """
+
+    def __init__(self, body: bytes, media_type: str):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        self.media_type = media_type
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # The gzip body is a different representation, so it gets its own strong ETag
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gz"'
+
+    def response(self, request: Request) -> Response:
+        gzipped = accepts_gzip(request.headers.get("accept-encoding", ""))
+        headers = {
+            "ETag": self.gzip_etag if gzipped else self.etag,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        # Either tag means the client holds this content, whichever encoding it came in
+        if_none_match = request.headers.get("if-none-match", "")
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if if_none_match.strip() == "*" or self.etag in tags or self.gzip_etag in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzipped, media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
+
+
+class PrecomputedDocs:
+    """
+    OpenAPI JSON and the docs pages, built once instead of on every request.
+
+    FastAPI caches the schema dict but serializes it and renders the docs HTML
+    on every request; here each is encoded, compressed and hashed once, at
+    startup or on first use when the app ran without its lifespan.
+    """
+
+    def __init__(self):
+        self.openapi: Optional[PrecomputedAsset] = None
+        self.swagger: Optional[PrecomputedAsset] = None
+        self.redoc: Optional[PrecomputedAsset] = None
+        self.oauth2_redirect: Optional[PrecomputedAsset] = None
+
+    def build(self, app: FastAPI) -> None:
+        schema = json.dumps(app.openapi(), separators=(",", ":")).encode()
+        self.openapi = PrecomputedAsset(schema, "application/json")
+        self.swagger = PrecomputedAsset(
+            get_swagger_ui_html(
+                openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI", oauth2_redirect_url=OAUTH2_REDIRECT_URL
+            ).body,
+            "text/html",
+        )
+        self.redoc = PrecomputedAsset(
+            get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc").body,
+            "text/html",
+        )
+        self.oauth2_redirect = PrecomputedAsset(get_swagger_ui_oauth2_redirect_html().body, "text/html")
+
+    def install(self, app: FastAPI) -> None:
+        def asset(name: str) -> PrecomputedAsset:
+            if self.openapi is None:
+                self.build(app)
+            return getattr(self, name)
+
+        @app.get(OPENAPI_URL, include_in_schema=False)
+        async def openapi_json(request: Request):
+            return asset("openapi").response(request)
+
+        @app.get(DOCS_URL, include_in_schema=False)
+        async def swagger_ui(request: Request):
+            return asset("swagger").response(request)
+
+        # Swagger UI's "Authorize" flow returns here; FastAPI only adds it with docs_url set
+        @app.get(OAUTH2_REDIRECT_URL, include_in_schema=False)
+        async def swagger_ui_redirect(request: Request):
+            return asset("oauth2_redirect").response(request)
+
+        @app.get(REDOC_URL, include_in_schema=False)
+        async def redoc(request: Request):
+            return asset("redoc").response(request)
+
+
+docs = PrecomputedDocs()
@@ -0,0 +1,68 @@
+import json
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, HTTPException, Request, status, Depends
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, AsyncReadSessionLocal
+from app.db.dependencies import reads_from_primary
+from app.db.user_repository import user_repository
+from app.services.logger import logger
+from app.auth.principal import Principal
+from app.auth.jwt_handler import get_current_user
+from app.utils.projection import parse_fields, user_columns, project
+
+
+router = APIRouter(prefix="/api/users", tags=["users"])
+
+async def stream_users(batch_size: int, names: list, session_factory: async_sessionmaker) -> AsyncIterator[bytes]:
+    # The response outlives the request's dependencies, so the stream owns its session.
+    # Plain column rows through a server-side cursor keep at most one batch in memory.
+    async with session_factory() as session:
+        try:
+            result = await user_repository.stream_all(session, user_columns(names), batch_size)
+            async for rows in result.partitions():
+                yield "".join(json.dumps(project(row, names)) + "\n" for row in rows).encode()
+        except Exception as e:
+            # Headers are already sent; aborting the body tells the client the export is incomplete
+            logger.error("Error streaming user export: %s", e)
+            raise
+
+
+@router.get("/export", summary="Export all users as NDJSON")
+async def export_users(request: Request, fields: Optional[str] = None, current_user: Principal = Depends(get_current_user)):
+    try:
+        if not current_user.email:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid user session"
+            )
+
+        try:
+            names = parse_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Clients pinned by a recent write export from the primary, like every other read
+        session_factory = AsyncSessionLocal if reads_from_primary(request) else AsyncReadSessionLocal
+        return StreamingResponse(
+            stream_users(settings.USERS_EXPORT_BATCH_SIZE, names, session_factory),
+            media_type="application/x-ndjson"
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error("Error: %s", e)
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "msg": f"{e}",
+                "status": False
+            }
+        )
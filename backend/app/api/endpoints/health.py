@@ -0,0 +1,43 @@
+import json
+from fastapi import APIRouter, Response, status
+
+from app.db.health import deep_health_check
+from app.services.warmup import warmup
+
+
+router = APIRouter(prefix="/api", tags=["health"])
+
+# Probes run every few seconds on every worker: bodies are encoded once and nothing is logged
+JSON = "application/json"
+HEALTHCHECK_BODY = json.dumps({"msg": "The API is LIVE!!"}).encode()
+LIVE_BODY = json.dumps({"status": "live"}).encode()
+READY_BODY = json.dumps({"status": "ready", "ready": True}).encode()
+NOT_READY_BODY = json.dumps({"status": "starting", "ready": False}).encode()
+DEGRADED_BODY = json.dumps({"status": "degraded", "ready": False}).encode()
+DB_UNAVAILABLE_BODY = json.dumps({"status": "db_unavailable", "ready": False}).encode()
+
+
+@router.get("/healthcheck", summary="Liveness probe")
+async def read_root():
+    return Response(HEALTHCHECK_BODY, media_type=JSON)
+
+@router.get("/live", summary="Liveness probe")
+async def liveness():
+    # No DB access, so a slow database never gets a live worker restarted
+    return Response(LIVE_BODY, media_type=JSON)
+
+@router.get("/ready", summary="Readiness probe")
+async def readiness(deep: bool = False):
+    # Ready once the lifespan warmup finished with a working pool
+    if not warmup.ready:
+        # A worker that started without the database rejoins once the cached DB check passes
+        if not (warmup.degraded and await deep_health_check.check()):
+            body = DEGRADED_BODY if warmup.degraded else NOT_READY_BODY
+            return Response(body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE, media_type=JSON)
+        warmup.recovered()
+
+    # deep=true adds a DB round trip, rate-limited and shared across probes
+    if deep and not await deep_health_check.check():
+        return Response(DB_UNAVAILABLE_BODY, status_code=status.HTTP_503_SERVICE_UNAVAILABLE, media_type=JSON)
+
+    return Response(READY_BODY, media_type=JSON)
@@ -0,0 +1,52 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+from app.db.database import engine, read_engine
+from app.db.pool_stats import pool_snapshot
+from app.db.user_repository import user_repository
+from app.db.health import health_monitor, read_health_monitor
+from app.auth.hashing import hashing_executor
+from app.auth.jwt_handler import blacklist_cache, token_cache
+from app.services.blacklist_purger import blacklist_purger
+from app.services.warmup import warmup
+
+
+async def require_stats_token(x_stats_token: Optional[str] = Header(default=None)) -> None:
+    # Without a configured token the endpoint does not exist
+    if not settings.STATS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if x_stats_token is None or not secrets.compare_digest(x_stats_token.encode(), settings.STATS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid stats token")
+
+
+router = APIRouter(
+    prefix="/api/internal", tags=["internal"], include_in_schema=False, dependencies=[Depends(require_stats_token)]
+)
+
+@router.get("/stats", status_code=status.HTTP_200_OK, summary="Live pool, cache and background task statistics")
+async def get_internal_stats():
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "pool": pool_snapshot(engine.sync_engine.pool),
+            "read_pool": pool_snapshot(read_engine.sync_engine.pool),
+            "db_health": health_monitor.stats(),
+            "read_db_health": read_health_monitor.stats(),
+            "hashing": {
+                "in_flight": hashing_executor.in_flight,
+                "workers": hashing_executor.workers,
+                "max_queue": hashing_executor.max_queue,
+            },
+            "jti_blacklist_cache": blacklist_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "jti_blacklist_purge": blacklist_purger.stats(),
+            "user_queries": user_repository.stats(),
+            "warmup": warmup.stats(),
+        }
+    )
@@ -1,15 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import timedelta
 
 from app.schemas import user as schemas
 from app.db.dependencies import get_db
-from app.models.user import User
+from app.db.user_repository import user_repository
 from app.services.logger import logger
 from app.auth.password import verify_password
-from app.auth.jwt_handler import create_access_token
+from app.auth.jwt_handler import create_token_pair
 
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -17,9 +15,7 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 @router.post("/login", status_code=status.HTTP_200_OK, summary="User logging in")
 async def login_user(user: schemas.Login, db: AsyncSession = Depends(get_db)):
     try:
-        query = select(User).where(User.email == user.email)
-        result = await db.execute(query)
-        db_user = result.scalar_one_or_none()
+        db_user = await user_repository.get_credentials(db, user.email)
 
         if not db_user:
             raise HTTPException(
@@ -33,12 +29,13 @@ async def login_user(user: schemas.Login, db: AsyncSession = Depends(get_db)):
                 detail="Incorrect password"
             )
     
-        token = await create_access_token({"email": user.email}, timedelta(minutes=15))
+        token, refresh_token = await create_token_pair(user.email, db_user.token_version, db_user.id)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK, 
             content={
                 "token": token, 
+                "refresh_token": refresh_token, 
                 "msg": "User logged in successfully", 
                 "status": True
             }
@@ -55,4 +52,4 @@ async def login_user(user: schemas.Login, db: AsyncSession = Depends(get_db)):
                 "msg": f"{e}", 
                 "status": False
             }
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dependencies import get_db
+from app.db.routing import mark_write
+from app.db.user_repository import user_repository
+from app.services.logger import logger
+from app.auth.principal import Principal
+from app.auth.jwt_handler import get_current_user
+
+
+router = APIRouter(prefix="/api/users", tags=["users"])
+
+@router.post("/log-out-all", status_code=status.HTTP_200_OK, summary="Logout current user from every session")
+async def logout_all_sessions(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    try:
+        # Every token carries the version it was issued with; bumping it revokes them all
+        rowcount = await user_repository.bump_token_version(db, current_user.id)
+        await db.commit()
+        mark_write(current_user.email)
+
+        if rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="User not found"
+            )
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "msg": "User logged out from all sessions", 
+                "status": True
+            }
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error("Logout all error: %s", e)
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "msg": f"An unexpected error occurred: {e}", 
+                "status": False
+            }
+        )
@@ -1,28 +1,49 @@
+from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.dependencies import get_db
+from app.db.routing import mark_write
 from app.models.jti_blacklist import JTIBlacklist
 from app.services.logger import logger
-from app.auth.jwt_handler import get_current_user
+from app.auth.principal import Principal
+from app.auth.jwt_handler import get_current_user, cache_token_revocation, refresh_token_expiry_bound
 
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.post("/log-out", status_code=status.HTTP_200_OK, summary="Logout current user")
-async def logout_user(current_user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def logout_user(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     try:
-        jti = current_user.get("jti") 
+        jti = current_user.jti 
         if not jti:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, 
                 detail="JTI not found in token"
             )
 
-        token_blacklist = JTIBlacklist(jti=jti)
-        db.add(token_blacklist)
+        exp = current_user.exp
+        expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None) if exp else None
+
+        rows = [{"jti": jti, "expires_at": expires_at}]
+
+        # Revoke the refresh token issued with this access token too, or it could
+        # keep minting new access tokens. Its exact expiry is not in the access
+        # token, so the row is kept for the longest possible refresh lifetime.
+        refresh_jti = current_user.refresh_jti
+        if refresh_jti:
+            refresh_expires_at = datetime.now(timezone.utc) + refresh_token_expiry_bound()
+            rows.append({"jti": refresh_jti, "expires_at": refresh_expires_at.replace(tzinfo=None)})
+
+        # IGNORE: the refresh token may already be blacklisted after a rotation
+        await db.execute(insert(JTIBlacklist).prefix_with("IGNORE").values(rows))
         await db.commit()
+        cache_token_revocation(jti, True, exp)
+        if refresh_jti:
+            cache_token_revocation(refresh_jti, True, refresh_expires_at.timestamp())
+        mark_write(current_user.email)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -43,4 +64,4 @@ async def logout_user(current_user: dict = Depends(get_current_user), db: AsyncS
                 "msg": f"An unexpected error occurred: {e}", 
                 "status": False
             }
-        )
\ No newline at end of file
+        )
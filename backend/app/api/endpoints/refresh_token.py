@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.schemas.item import RefreshToken
+from app.db.dependencies import get_db
+from app.db.routing import mark_write
+from app.db.user_repository import user_repository
+from app.models.jti_blacklist import JTIBlacklist
+from app.services.logger import logger
+from app.auth.jwt_handler import (
+    REFRESH_TOKEN_TYPE,
+    cache_token_revocation,
+    create_token_pair,
+    decode_access_token,
+)
+
+
+router = APIRouter(prefix="/api/users", tags=["users"])
+
+async def revoke_all_sessions(db: AsyncSession, user: Row) -> None:
+    await user_repository.bump_token_version(db, user.id)
+    await db.commit()
+    mark_write(user.email)
+
+@router.post("/refresh", status_code=status.HTTP_200_OK, summary="Exchange a refresh token for new tokens")
+async def refresh_access_token(body: RefreshToken, db: AsyncSession = Depends(get_db)):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    revoked_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Refresh token has been revoked"
+    )
+    try:
+        payload = await decode_access_token(body.refresh_token)
+        if payload is None or payload.get("type") != REFRESH_TOKEN_TYPE:
+            raise credentials_exception
+
+        jti = payload.get("jti")
+        email = payload.get("email")
+        exp = payload.get("exp")
+
+        if not all([email, jti, exp]):
+            raise credentials_exception
+
+        user, rotated = await user_repository.get_with_rotation(db, email, jti)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="User not found"
+            )
+
+        if rotated:
+            # A rotated refresh token came back: assume it leaked and end every session
+            logger.warning(f"Refresh token reuse: jti={jti}, email={email}")
+            await revoke_all_sessions(db, user)
+            raise revoked_exception
+
+        # Revoked by a logout: a client retrying after logging out is not an attack
+        if rotated is False:
+            raise revoked_exception
+
+        # Issued for a row since deleted; the same email may now belong to a new account
+        if payload.get("sub") != str(user.id) or payload.get("ver", 0) != user.token_version:
+            raise revoked_exception
+
+        # Rotate: the presented token can be used exactly once
+        expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
+        db.add(JTIBlacklist(jti=jti, expires_at=expires_at, rotated=True))
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent request rotated the same token first: that is reuse too
+            await db.rollback()
+            logger.warning(f"Concurrent refresh token reuse: jti={jti}, email={email}")
+            await revoke_all_sessions(db, user)
+            raise revoked_exception
+        cache_token_revocation(jti, True, exp)
+        mark_write(user.email)
+
+        token, refresh_token = await create_token_pair(user.email, user.token_version, user.id)
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "token": token, 
+                "refresh_token": refresh_token, 
+                "msg": "Token refreshed successfully", 
+                "status": True
+            }
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error("Refresh error: %s", e)
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "msg": f"An unexpected error occurred: {e}", 
+                "status": False
+            }
+        )
@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app.schemas import user as schemas
 from app.db.dependencies import get_db
-from app.models.user import User
+from app.db.routing import mark_write
+from app.db.user_repository import user_repository
 from app.services.logger import logger
 from app.auth.password import get_password_hash
 
@@ -13,17 +14,18 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 @router.post("/signup", status_code=status.HTTP_201_CREATED, summary="Add a new user")
 async def signup_user(user: schemas.User, db: AsyncSession = Depends(get_db)):
     hashed_password = await get_password_hash(user.password)
-    new_user = User(
-        name=user.name,
-        email=user.email,
-        phone_no=user.phone_no,
-        password_hash=hashed_password,
-    )
 
     try:
-        db.add(new_user)
+        # A single INSERT; the created row is never read back
+        await user_repository.create(
+            db,
+            name=user.name,
+            email=user.email,
+            phone_no=user.phone_no,
+            password_hash=hashed_password,
+        )
         await db.commit()
-        await db.refresh(new_user)
+        mark_write(user.email)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"msg": "User created successfully", "status": True},
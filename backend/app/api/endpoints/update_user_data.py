@@ -1,12 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas import user as schemas
 from app.db.dependencies import get_db
-from app.models.user import User
+from app.db.routing import mark_write
+from app.db.user_repository import user_repository
 from app.services.logger import logger
+from app.auth.principal import Principal
 from app.auth.jwt_handler import get_current_user
 from app.utils.validation import get_current_utc_time
 
@@ -14,20 +15,8 @@ from app.utils.validation import get_current_utc_time
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.put("/update-data", status_code=status.HTTP_200_OK, summary="update existing data")
-async def update_data(update_user: schemas.Update_user, current_user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def update_data(update_user: schemas.Update_user, current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     try:
-        email = current_user["email"]
-        
-        query = select(User).where(User.email == email)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail="User not found"
-            )
-        
         update_fields=dict()
 
         if update_user.name:
@@ -44,9 +33,16 @@ async def update_data(update_user: schemas.Update_user, current_user: dict = Dep
 
         update_fields["updated_at"] = await get_current_utc_time()
 
-        query = update(User).where(User.email == user.email).values(**update_fields)
-        result = await db.execute(query)
+        # The row was loaded by get_current_user; a vanished row shows up as rowcount 0
+        rowcount = await user_repository.update_profile(db, current_user.id, update_fields)
         await db.commit()
+        mark_write(current_user.email)
+
+        if rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="User not found"
+            )
 
         return JSONResponse(
             status_code=status.HTTP_200_OK, 
@@ -67,4 +63,4 @@ async def update_data(update_user: schemas.Update_user, current_user: dict = Dep
                 "msg":f"{e}", 
                 "status": False
             }
-        )
\ No newline at end of file
+        )
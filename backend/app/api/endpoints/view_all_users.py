@@ -1,50 +1,82 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.dependencies import get_db
+from app.core.config import settings
+from app.db.dependencies import get_read_db
+from app.db.user_repository import user_repository
 from app.models.user import User
 from app.services.logger import logger
+from app.auth.principal import Principal
 from app.auth.jwt_handler import get_current_user
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.projection import parse_fields, user_columns, project
 
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.get("/", status_code=status.HTTP_200_OK, summary="Get all users")
-async def get_all_users(current_user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def get_all_users(
+    limit: int = Query(settings.USERS_PAGE_SIZE, ge=1, le=settings.USERS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
     try:
-        email = current_user["email"]
+        email = current_user.email
         if not email:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 detail="Invalid user session"
             )
 
-        query = select(User)
-        result = await db.execute(query)
-        users = result.scalars().all()
+        try:
+            names = parse_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, 
+                detail=str(e)
+            )
+
+        after_id = 0
+        if cursor is not None:
+            after_id = decode_cursor(cursor)
+            if after_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, 
+                    detail="Invalid cursor"
+                )
+
+        # Only the requested columns, as Core rows; id is always needed for the cursor
+        columns = user_columns(names)
+        if "id" not in names:
+            columns.append(User.id)
 
-        if not users:
+        # Keyset on the primary key: each page is an index range scan, however deep
+        # One extra row tells whether another page follows
+        rows = await user_repository.list_page(db, columns, after_id, limit + 1)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].id)
+
+        if not rows and cursor is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
                 detail="No users found"
             )
 
-        users_data =[{
-            "id": u.id,
-            "name": u.name,
-            "email": u.email,
-            "phone_no": u.phone_no,
-            "created_at": u.created_at.isoformat() if u.created_at else None,
-            "updated_at": u.updated_at.isoformat() if u.updated_at else None
-        } for u in users]
+        users_data = [project(row, names) for row in rows]
 
         return JSONResponse(
             status_code=status.HTTP_200_OK, 
             content={
                 "status": True, 
-                "data": users_data
+                "data": users_data,
+                "next_cursor": next_cursor
             }
         )
     
@@ -59,4 +91,4 @@ async def get_all_users(current_user: dict = Depends(get_current_user), db: Asyn
                 "msg": f"{e}", 
                 "status": False
             }
-        )
\ No newline at end of file
+        )
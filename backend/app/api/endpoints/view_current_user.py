@@ -1,44 +1,35 @@
+from typing import Optional
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.dependencies import get_db
-from app.models.user import User
 from app.services.logger import logger
+from app.auth.principal import Principal
 from app.auth.jwt_handler import get_current_user
+from app.utils.projection import parse_fields, project
 
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.get("/me", summary="Get current logged-in user")
-async def get_current_user_data(current_user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def get_current_user_data(fields: Optional[str] = None, current_user: Principal = Depends(get_current_user)):
     try:
-        email = current_user["email"]
+        email = current_user.email
         if not email:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 detail="Invalid user mail"
             )
-        
-        query = select(User).where(User.email == email)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
 
-        if not user:
+        try:
+            names = parse_fields(fields)
+        except ValueError as e:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail="User not found"
+                status_code=status.HTTP_400_BAD_REQUEST, 
+                detail=str(e)
             )
 
-        users_data ={
-            "id": user.id,
-            "name": user.name,
-            "email": user.email,
-            "phone_no": user.phone_no,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-            "updated_at": user.updated_at.isoformat() if user.updated_at else None
-        }
+        # get_current_user has already loaded this row for the request
+        users_data = project(current_user, names)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK, 
@@ -59,4 +50,4 @@ async def get_current_user_data(current_user: dict = Depends(get_current_user),
                 "msg": str(e),
                 "status": False
             }
-        )
\ No newline at end of file
+        )
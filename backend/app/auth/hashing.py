@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.services.logger import logger
+
+
+class HashingExecutor:
+    """
+    Bounded worker pool for CPU-heavy password hashing.
+
+    bcrypt calls take a few hundred milliseconds, so they are run in a thread or
+    process pool instead of on the event loop. Once every worker is busy and the
+    wait queue is full, new calls are rejected with a 503 instead of piling up.
+    """
+
+    def __init__(self, kind: str = "thread", workers: int = 4, max_queue: int = 32):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown hashing executor kind: {kind}")
+
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        # Jobs finish on worker threads, so the counter is shared across threads
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hashing")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._in_flight >= self.workers + self.max_queue:
+            logger.warning("Hashing queue full: %d calls in flight", self._in_flight)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"},
+            )
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._get_executor().submit(partial(func, *args))
+        except BaseException:
+            self._job_done()
+            raise
+        # Counted until the job itself ends: a request that gives up (a client
+        # disconnect cancels it) leaves a started bcrypt call still running
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    def _job_done(self, future: Future | None = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_executor = HashingExecutor(
+    kind=settings.HASH_EXECUTOR,
+    workers=settings.HASH_WORKERS,
+    max_queue=settings.HASH_MAX_QUEUE,
+)
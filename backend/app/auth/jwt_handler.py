@@ -1,89 +1,208 @@
 from datetime import timedelta
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from jose import JWTError, jwt
 from dotenv import load_dotenv
+import hashlib
 import os
+import random
+import time
 import uuid
 
+from app.core.config import settings
 from app.models.jti_blacklist import JTIBlacklist
 from app.utils.validation import get_current_utc_time
-from app.auth.user import get_user
-from app.db.dependencies import get_db
+from app.auth.user import get_user, get_user_with_revocation
+from app.auth.principal import Principal
+from app.db.dependencies import get_read_db
 from app.services.logger import logger
+from app.utils.cache import TTLCache
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+# The "type" claim value, not a credential
+REFRESH_TOKEN_TYPE = "refresh"  # nosec B105
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 
-async def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
+# jti -> revoked? Revoked entries live until the token expires, clean ones only briefly
+blacklist_cache = TTLCache(maxsize=settings.JTI_CACHE_SIZE)
+
+# sha256(token) -> verified claims, dropped once the token expires
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+_sysrandom = random.SystemRandom()
+
+def jittered(delta: timedelta) -> timedelta:
+    """
+    Spreads token lifetimes by +/- TOKEN_EXPIRE_JITTER so tokens issued together
+    do not all expire, and come back for renewal, at the same moment.
+    """
+    spread = delta.total_seconds() * settings.TOKEN_EXPIRE_JITTER
+    return delta + timedelta(seconds=_sysrandom.uniform(-spread, spread))
+
+async def create_access_token(data: dict, expires_delta: timedelta = None, jti: str = None) -> str:
     to_encode = data.copy()
     expire = await get_current_utc_time() + (expires_delta or timedelta(minutes=15))
-    jti = str(uuid.uuid4())
+    jti = jti or str(uuid.uuid4())
     to_encode.update({"exp": expire, "jti": jti})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+async def create_refresh_token(data: dict, expires_delta: timedelta = None, jti: str = None) -> str:
+    to_encode = {**data, "type": REFRESH_TOKEN_TYPE}
+    return await create_access_token(to_encode, expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS), jti)
+
+async def create_token_pair(email: str, token_version: int, user_id: int) -> tuple[str, str]:
+    # "sub" binds both tokens to this row; JWT subjects are strings
+    claims = {"sub": str(user_id), "email": email, "ver": token_version}
+    # The access token names its refresh token ("rjti") so logout can revoke both
+    refresh_jti = str(uuid.uuid4())
+    access_token = await create_access_token(
+        {**claims, "rjti": refresh_jti}, jittered(timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    )
+    refresh_token = await create_refresh_token(
+        claims, jittered(timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)), refresh_jti
+    )
+    return access_token, refresh_token
+
+def refresh_token_expiry_bound() -> timedelta:
+    # The longest a refresh token can live, jitter included
+    return timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS) * (1 + settings.TOKEN_EXPIRE_JITTER)
+
 async def decode_access_token(token: str):
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
-async def is_token_blacklisted(jti: str, db: AsyncSession) -> bool:
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, payload, exp)
+    return dict(payload)
+
+def cache_token_revocation(jti: str, revoked: bool, exp: float | None = None) -> None:
+    now = time.time()
+    if revoked:
+        expires_at = exp or now + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    else:
+        expires_at = now + settings.JTI_CACHE_NEGATIVE_TTL
+        if exp:
+            expires_at = min(expires_at, exp)
+    blacklist_cache.set(jti, revoked, expires_at)
+
+async def is_token_blacklisted(jti: str, db: AsyncSession, exp: float | None = None) -> bool:
+    cached = blacklist_cache.get(jti)
+    if cached is not None:
+        return cached
+
     query = select(JTIBlacklist).where(JTIBlacklist.jti == jti)
     result = await db.execute(query)
-    return result.scalar_one_or_none() is not None
+    revoked = result.scalar_one_or_none() is not None
+    cache_token_revocation(jti, revoked, exp)
+    return revoked
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+async def get_token_payload(request: Request, token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Validates the bearer token without touching the database, so malformed,
+    badly signed, expired or known-revoked tokens never check out a connection.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = await decode_access_token(token)
-        if payload is None:
-            raise credentials_exception
-        
-        jti = payload.get("jti")
-        email = payload.get("email")
-        exp = payload.get("exp")
-
-        if not all ([email, jti, exp]):
-            raise credentials_exception
-
-        
-        if await is_token_blacklisted(jti, db):
-            logger.warning(f"Revoked token attempt: jti={jti}, email={email}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has been revoked"
-            )
+    payload = await decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
 
-        user = await get_user(email=email, db=db)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail="User not found"
-            )
-        
-        user_dict = user.__dict__.copy()
-        user_dict.update({
-            "token": token,
-            "jti": jti,
-            "exp": exp
-        })
-
-        return user_dict
+    jti = payload.get("jti")
+    email = payload.get("email")
+    exp = payload.get("exp")
 
-    except JWTError:
+    if not all ([email, jti, exp]):
+        raise credentials_exception
+
+    # Refresh tokens are only accepted by the refresh endpoint
+    if payload.get("type") == REFRESH_TOKEN_TYPE:
         raise credentials_exception
 
+    revoked = blacklist_cache.get(jti)
+    if revoked:
+        logger.warning(f"Revoked token attempt: jti={jti}, email={email}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+
+    # get_current_user reuses this answer, so a request costs one cache lookup
+    request.state.cached_revocation = revoked
+    # Lets get_read_db keep this user's reads on the primary right after a write
+    request.state.principal_email = email
+    return payload
+
+
+# get_token_payload is listed first so FastAPI resolves it before opening a session
+async def get_current_user(
+    request: Request, payload: dict = Depends(get_token_payload), db: AsyncSession = Depends(get_read_db)
+) -> Principal:
+    jti = payload["jti"]
+    email = payload["email"]
+    exp = payload["exp"]
+
+    # Known revocation state costs at most the user query; otherwise
+    # the user and the blacklist are checked in a single statement
+    revoked = getattr(request.state, "cached_revocation", None)
+    if revoked is None:
+        user, revoked = await get_user_with_revocation(email=email, jti=jti, db=db)
+        # Without a user row the blacklist EXISTS was never evaluated
+        if user is not None:
+            cache_token_revocation(jti, revoked, exp)
+    elif not revoked:
+        user = await get_user(email=email, db=db)
 
+    # Release the pooled connection before the route runs; the session
+    # checks out a fresh one only if the handler queries again
+    await db.close()
+
+    if revoked:
+        logger.warning(f"Revoked token attempt: jti={jti}, email={email}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, 
+            detail="User not found"
+        )
+
+    # A deleted account re-created under the same email is a new row with a new
+    # id, and its token_version starts over; tokens for the old row must not match
+    if payload.get("sub") != str(user.id):
+        logger.warning(f"Token subject mismatch: jti={jti}, email={email}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+
+    # Tokens minted before the last "log out everywhere" carry an older version
+    if payload.get("ver", 0) != user.token_version:
+        logger.warning(f"Stale token version: jti={jti}, email={email}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+
+    return Principal.from_row(user, jti=jti, exp=exp, refresh_jti=payload.get("rjti"))
@@ -1,9 +1,20 @@
 from passlib.context import CryptContext
 
+from app.auth.hashing import hashing_executor
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-async def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
-async def get_password_hash(password: str) -> str:
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_executor.run(_verify, plain_password, hashed_password)
+
+async def get_password_hash(password: str) -> str:
+    return await hashing_executor.run(_hash, password)
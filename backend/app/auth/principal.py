@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Row
+
+
+class Principal(NamedTuple):
+    """
+    The authenticated user for one request.
+
+    Holds only the user fields handlers read plus the token's jti/exp, so it
+    never carries the password hash or SQLAlchemy instance state around. A
+    NamedTuple is immutable, has no per-instance ``__dict__`` and builds in
+    under half the time of a frozen dataclass (scripts/bench_principal.py).
+    """
+
+    id: int
+    name: str
+    email: str
+    phone_no: Optional[int]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    jti: str
+    exp: int
+    # jti of the refresh token issued with this access token, when it names one
+    refresh_jti: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Row, jti: str, exp: int, refresh_jti: Optional[str] = None) -> "Principal":
+        # Rows select PRINCIPAL_COLUMNS, which start with these six fields in this order.
+        # Slicing is a plain tuple operation; each Row attribute read is a key lookup.
+        return cls(*row[:6], jti, exp, refresh_jti)
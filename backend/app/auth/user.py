@@ -1,16 +1,15 @@
-from sqlalchemy import select
+from typing import Optional
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 
 from app.db.dependencies import get_db
-from app.models.user import User
+from app.db.user_repository import user_repository
 from app.services.logger import logger
 
 async def get_user(email: str, db: AsyncSession = Depends(get_db)):
     try:
-        query = select(User).where(User.email == email)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
+        user = await user_repository.get_by_email(db, email)
 
         if not user:
             raise HTTPException(
@@ -30,4 +29,16 @@ async def get_user(email: str, db: AsyncSession = Depends(get_db)):
         )
 
 
+async def get_user_with_revocation(email: str, jti: str, db: AsyncSession) -> tuple[Optional[Row], bool]:
+    """
+    Loads the user and whether the token's JTI is blacklisted in one round trip.
+    """
+    try:
+        return await user_repository.get_with_revocation(db, email, jti)
 
+    except Exception as e:
+        logger.error("Error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="Internal Server Error"
+        )
@@ -11,8 +11,28 @@ class Settings(BaseSettings):
     """
 
     # Server Configs
+    # Loopback unless told otherwise; the Docker image sets HOST=0.0.0.0
+    HOST: str = config("HOST", default="127.0.0.1")
     PORT: int = config("PORT", cast=int, default=8080)
+    # Server processes for `python -m app`, 0 means one per CPU core. Each worker
+    # has its own connection pools, so the database sees WORKERS x DB_POOL_SIZE
+    WORKERS: int = config("WORKERS", cast=int, default=0)
+    LOOP: str = config("LOOP", default="auto")  # "auto" picks uvloop when installed, or "asyncio"
+    HTTP: str = config("HTTP", default="auto")  # "auto" picks httptools when installed, or "h11"
+    BACKLOG: int = config("BACKLOG", cast=int, default=2048)
+    # Seconds an idle keep-alive connection stays open
+    KEEP_ALIVE: int = config("KEEP_ALIVE", cast=int, default=5)
+    # Per worker; above it new requests get a 503 (0 means no limit)
+    LIMIT_CONCURRENCY: int = config("LIMIT_CONCURRENCY", cast=int, default=0)
+    # Requests after which a worker is restarted (0 means never)
+    LIMIT_MAX_REQUESTS: int = config("LIMIT_MAX_REQUESTS", cast=int, default=0)
+    # Seconds in-flight requests get to finish on shutdown
+    TIMEOUT_GRACEFUL_SHUTDOWN: int = config("TIMEOUT_GRACEFUL_SHUTDOWN", cast=int, default=30)
     DEBUG: bool = config("DEBUG", cast=bool, default=False)
+    # Serve /docs, /redoc and /openapi.json; turn off in production
+    DOCS_ENABLED: bool = config("DOCS_ENABLED", cast=bool, default=True)
+    # Required in the X-Stats-Token header of /api/internal/stats; unset, the endpoint is a 404
+    STATS_TOKEN: str = config("STATS_TOKEN", default="")
 
     # Database configs
     MYSQL_DATABASE: str = config("MYSQL_DATABASE", default='test_database')
@@ -21,6 +41,60 @@ class Settings(BaseSettings):
     MYSQL_PORT: int = config("MYSQL_PORT", cast=int, default=3306)
     MYSQL_HOST: str = config("MYSQL_HOST", default="localhost")
 
+    # Optional read replica; reads stay on the primary when unset
+    MYSQL_REPLICA_HOST: str = config("MYSQL_REPLICA_HOST", default="")
+    MYSQL_REPLICA_PORT: int = config("MYSQL_REPLICA_PORT", cast=int, default=3306)
+    # Seconds a user's reads stay on the primary after they write. Across workers
+    # this relies on the signed rw_pin cookie, so clients must send cookies back
+    READ_YOUR_WRITES_SECONDS: int = config("READ_YOUR_WRITES_SECONDS", cast=int, default=5)
+    # Isolation level of the read pool: AUTOCOMMIT, READ COMMITTED or REPEATABLE READ
+    READ_ISOLATION_LEVEL: str = config("READ_ISOLATION_LEVEL", default="AUTOCOMMIT")
+
+    # Connection pool configs (recycle and timeout in seconds)
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", cast=int, default=5)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", cast=int, default=10)
+    DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", cast=int, default=1800)
+    DB_POOL_TIMEOUT: int = config("DB_POOL_TIMEOUT", cast=int, default=30)
+    # Connections opened per pool at startup, capped at DB_POOL_SIZE (0 disables)
+    DB_POOL_PREWARM: int = config("DB_POOL_PREWARM", cast=int, default=5)
+    # Per-checkout ping. Only turn it off when DB_POOL_RECYCLE is below the MySQL
+    # wait_timeout and any proxy idle timeout, or idle connections reach requests dead
+    DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", cast=bool, default=True)
+    DB_HEALTHCHECK_INTERVAL: int = config("DB_HEALTHCHECK_INTERVAL", cast=int, default=10)
+    # /api/ready?deep=true runs at most one DB check per TTL seconds
+    HEALTH_DEEP_CHECK_TTL: float = config("HEALTH_DEEP_CHECK_TTL", cast=float, default=5)
+    HEALTH_DEEP_CHECK_TIMEOUT: float = config("HEALTH_DEEP_CHECK_TIMEOUT", cast=float, default=2)
+    # Seconds `python -m app.db.migrate` waits for another run to finish
+    DB_MIGRATION_LOCK_TIMEOUT: int = config("DB_MIGRATION_LOCK_TIMEOUT", cast=int, default=60)
+
+    # Password hashing configs
+    HASH_EXECUTOR: str = config("HASH_EXECUTOR", default="thread")  # "thread" or "process"
+    HASH_WORKERS: int = config("HASH_WORKERS", cast=int, default=4)
+    HASH_MAX_QUEUE: int = config("HASH_MAX_QUEUE", cast=int, default=32)
+
+    # Token revocation cache configs
+    JTI_CACHE_SIZE: int = config("JTI_CACHE_SIZE", cast=int, default=10000)
+    # How long a "not revoked" answer is trusted; bounds staleness across workers
+    JTI_CACHE_NEGATIVE_TTL: int = config("JTI_CACHE_NEGATIVE_TTL", cast=int, default=5)
+
+    # Token lifetime configs (jitter is a fraction of the lifetime)
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = config("ACCESS_TOKEN_EXPIRE_MINUTES", cast=int, default=15)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = config("REFRESH_TOKEN_EXPIRE_DAYS", cast=int, default=7)
+    TOKEN_EXPIRE_JITTER: float = config("TOKEN_EXPIRE_JITTER", cast=float, default=0.1)
+
+    # Verified access token cache configs
+    TOKEN_CACHE_SIZE: int = config("TOKEN_CACHE_SIZE", cast=int, default=10000)
+
+    # Expired JTI purge configs (interval in seconds, 0 disables the task)
+    JTI_PURGE_INTERVAL: int = config("JTI_PURGE_INTERVAL", cast=int, default=300)
+    JTI_PURGE_BATCH_SIZE: int = config("JTI_PURGE_BATCH_SIZE", cast=int, default=1000)
+
+    # User listing page sizes (requests above the maximum are rejected)
+    USERS_PAGE_SIZE: int = config("USERS_PAGE_SIZE", cast=int, default=50)
+    USERS_MAX_PAGE_SIZE: int = config("USERS_MAX_PAGE_SIZE", cast=int, default=500)
+    # Rows fetched per server-side cursor round trip in the NDJSON export
+    USERS_EXPORT_BATCH_SIZE: int = config("USERS_EXPORT_BATCH_SIZE", cast=int, default=1000)
+
     @property
     def ASYNC_DB_URL(self) -> str:
         # Always use MYSQL_HOST unless it's not provided
@@ -29,5 +103,14 @@ class Settings(BaseSettings):
             f"@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
         )
 
+    @property
+    def ASYNC_REPLICA_DB_URL(self) -> str | None:
+        if not self.MYSQL_REPLICA_HOST:
+            return None
+        return (
+            f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
+            f"@{self.MYSQL_REPLICA_HOST}:{self.MYSQL_REPLICA_PORT}/{self.MYSQL_DATABASE}"
+        )
+
 
 settings = Settings()
@@ -3,6 +3,8 @@ from app.models.jti_blacklist import JTIBlacklist
 from app.db.database import Base, engine
 
 async def initialize_db():
+    # Builds the tables straight from the models for throwaway databases;
+    # anything long-lived goes through `python -m app.db.migrate`
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
\ No newline at end of file
+    
\ No newline at end of file
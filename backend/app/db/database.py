@@ -1,9 +1,32 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
+from app.db.pool_stats import InstrumentedAsyncQueuePool
 
 
-engine = create_async_engine(settings.ASYNC_DB_URL, pool_pre_ping=True)
+def _create_engine(url: str, **kwargs):
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        **kwargs,
+    )
+
+
+engine = _create_engine(settings.ASYNC_DB_URL)
+
+# Read paths get their own pool, on the replica when there is one, with the
+# isolation level fixed once per connection. Under AUTOCOMMIT a read opens no
+# transaction, so nothing is rolled back when the connection is returned.
+read_engine = _create_engine(
+    settings.ASYNC_REPLICA_DB_URL or settings.ASYNC_DB_URL,
+    isolation_level=settings.READ_ISOLATION_LEVEL,
+    pool_reset_on_return=None if settings.READ_ISOLATION_LEVEL == "AUTOCOMMIT" else "rollback",
+)
 
 AsyncSessionLocal= async_sessionmaker(
     autocommit=False, 
@@ -13,6 +36,14 @@ AsyncSessionLocal= async_sessionmaker(
     expire_on_commit=False,
     )
 
+AsyncReadSessionLocal= async_sessionmaker(
+    autocommit=False, 
+    autoflush=False, 
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    )
+
 class Base(DeclarativeBase):
     pass
 
@@ -1,5 +1,8 @@
 from typing import AsyncGenerator
-from app.db.database import AsyncSessionLocal
+from fastapi import Depends, Request
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, AsyncReadSessionLocal
+from app.db.routing import PIN_COOKIE, is_pinned_to_primary
 from sqlalchemy.ext.asyncio import AsyncSession
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -8,3 +11,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+def reads_from_primary(request: Request) -> bool:
+    # Right after this user wrote, a lagging replica could miss it; stay on the primary.
+    # The pin cookie covers writes that another worker handled.
+    email = getattr(request.state, "principal_email", None)
+    return bool(settings.ASYNC_REPLICA_DB_URL) and is_pinned_to_primary(email, request.cookies.get(PIN_COOKIE))
+
+async def get_read_db(request: Request, db: AsyncSession = Depends(get_db)) -> AsyncGenerator[AsyncSession, None]:
+    # Sessions connect lazily, so the unused primary session costs no connection.
+    if reads_from_primary(request):
+        yield db
+        return
+
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
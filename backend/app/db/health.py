@@ -0,0 +1,146 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.db.database import engine, read_engine
+from app.services.logger import logger
+
+
+class ConnectionHealthMonitor:
+    """
+    Periodically validates the connection pool off the request path.
+
+    Each probe checks out a single connection, so it catches an outage or a
+    failover, not every connection the server or a proxy closed while idle;
+    per-checkout pre-ping (DB_POOL_PRE_PING) covers those. A changed server
+    identity (failover to another host) or a probe error disposes the whole
+    pool so the next checkout reconnects.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: int = 10):
+        self.engine = engine
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+        self.server_identity: Optional[tuple] = None
+        self.healthy: Optional[bool] = None
+        self.checks = 0
+        self.failures = 0
+        self.failovers = 0
+        self.last_check_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    async def check_once(self) -> bool:
+        self.checks += 1
+        self.last_check_at = datetime.now(timezone.utc)
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(text("SELECT @@server_id, @@hostname"))
+                identity = tuple(result.one())
+        except Exception as e:
+            self.failures += 1
+            self.healthy = False
+            self.last_error = str(e)
+            logger.warning("DB health check failed, invalidating pool: %s", e)
+            await self.engine.dispose()
+            return False
+
+        if self.server_identity is not None and identity != self.server_identity:
+            self.failovers += 1
+            logger.warning("DB server changed from %s to %s, invalidating pool", self.server_identity, identity)
+            await self.engine.dispose()
+
+        self.server_identity = identity
+        self.healthy = True
+        self.last_error = None
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("DB health monitor error: %s", e)
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="db-health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "checks": self.checks,
+            "failures": self.failures,
+            "failovers": self.failovers,
+            "last_check_at": self.last_check_at.isoformat() if self.last_check_at else None,
+            "last_error": self.last_error,
+        }
+
+
+class CachedHealthCheck:
+    """
+    On-demand DB check for the deep readiness probe.
+
+    At most one `SELECT 1` runs per `ttl` seconds however often it is probed;
+    concurrent probes wait for the check in flight instead of starting their
+    own, and a probe never blocks for longer than `timeout`.
+    """
+
+    def __init__(self, engine: AsyncEngine, ttl: float = 5, timeout: float = 2):
+        self.engine = engine
+        self.ttl = ttl
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+
+        self.healthy: Optional[bool] = None
+        self.checked_at: Optional[float] = None
+        self.probes = 0
+
+    def _fresh(self) -> bool:
+        return self.checked_at is not None and time.monotonic() - self.checked_at < self.ttl
+
+    async def _probe(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def check(self) -> bool:
+        if self._fresh():
+            return self.healthy
+
+        async with self._lock:
+            if self._fresh():
+                return self.healthy
+
+            self.probes += 1
+            try:
+                await asyncio.wait_for(self._probe(), self.timeout)
+                self.healthy = True
+            except Exception as e:
+                logger.warning("Deep health check failed: %s", e)
+                self.healthy = False
+            self.checked_at = time.monotonic()
+        return self.healthy
+
+
+health_monitor = ConnectionHealthMonitor(engine, interval=settings.DB_HEALTHCHECK_INTERVAL)
+read_health_monitor = ConnectionHealthMonitor(read_engine, interval=settings.DB_HEALTHCHECK_INTERVAL)
+deep_health_check = CachedHealthCheck(engine, ttl=settings.HEALTH_DEEP_CHECK_TTL, timeout=settings.HEALTH_DEEP_CHECK_TIMEOUT)
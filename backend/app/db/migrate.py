@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+from app.db.database import engine
+from app.db.migrations import MIGRATIONS, LATEST_VERSION
+from app.services.logger import logger
+
+# MySQL error for a missing table
+NO_SUCH_TABLE = 1146
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER NOT NULL,
+    description VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (version)
+)
+"""
+
+
+def _lock_name() -> str:
+    # GET_LOCK names are server-wide; scope the lock to this database
+    return f"{settings.MYSQL_DATABASE}.schema_migrations"[:64]
+
+
+async def get_schema_version(conn: AsyncConnection) -> int:
+    try:
+        result = await conn.execute(text("SELECT MAX(version) FROM schema_version"))
+    except ProgrammingError as e:
+        if e.orig.args[0] == NO_SUCH_TABLE:
+            return 0
+        raise
+    return result.scalar() or 0
+
+
+async def migrate(engine: AsyncEngine = engine) -> list:
+    """
+    Applies pending migrations under a MySQL named lock and returns their versions.
+
+    Concurrent runs queue on the lock; whoever gets it second finds nothing
+    left to do, so DDL never races. The lock is held by the connection and
+    released on exit even if a migration fails.
+    """
+    applied = []
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": _lock_name(), "timeout": settings.DB_MIGRATION_LOCK_TIMEOUT},
+        )
+        if result.scalar() != 1:
+            raise RuntimeError("Timed out waiting for the schema migration lock")
+
+        try:
+            await conn.execute(text(SCHEMA_VERSION_TABLE))
+            await conn.commit()
+
+            current = await get_schema_version(conn)
+            for migration in MIGRATIONS:
+                if migration.VERSION <= current:
+                    continue
+
+                logger.info("Applying migration %04d: %s", migration.VERSION, migration.DESCRIPTION)
+                await migration.upgrade(conn)
+                await conn.execute(
+                    text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+                    {"version": migration.VERSION, "description": migration.DESCRIPTION},
+                )
+                await conn.commit()
+                applied.append(migration.VERSION)
+        finally:
+            await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": _lock_name()})
+
+    return applied
+
+
+async def check_schema_version(engine: AsyncEngine = engine) -> int:
+    """
+    The startup check: one query, no DDL. Refuses to serve on a schema that is behind.
+    """
+    async with engine.connect() as conn:
+        version = await get_schema_version(conn)
+
+    if version < LATEST_VERSION:
+        raise RuntimeError(
+            f"Database schema is at version {version}, this build needs {LATEST_VERSION}. "
+            "Run `python -m app.db.migrate` first."
+        )
+    if version > LATEST_VERSION:
+        # A newer build migrated first during a rolling deploy; migrations are additive
+        logger.warning("Database schema version %s is newer than this build (%s)", version, LATEST_VERSION)
+    return version
+
+
+async def main(status_only: bool = False) -> None:
+    try:
+        if status_only:
+            async with engine.connect() as conn:
+                version = await get_schema_version(conn)
+            print(f"Schema version {version}, latest {LATEST_VERSION}")
+            return
+
+        applied = await migrate(engine)
+        if applied:
+            print(f"Applied migrations: {', '.join(str(version) for version in applied)}")
+        else:
+            print(f"Schema is up to date at version {LATEST_VERSION}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply database schema migrations")
+    parser.add_argument("--status", action="store_true", help="print the current schema version and exit")
+    args = parser.parse_args()
+    asyncio.run(main(status_only=args.status))
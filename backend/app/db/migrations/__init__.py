@@ -0,0 +1,11 @@
+from app.db.migrations import v0001_initial, v0002_jti_expires_at, v0003_user_token_version, v0004_jti_rotated
+
+# Applied in order; append new modules here and never edit one that has shipped
+MIGRATIONS = [
+    v0001_initial,
+    v0002_jti_expires_at,
+    v0003_user_token_version,
+    v0004_jti_rotated,
+]
+
+LATEST_VERSION = MIGRATIONS[-1].VERSION
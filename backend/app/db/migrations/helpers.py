@@ -0,0 +1,24 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def column_exists(conn: AsyncConnection, table: str, column: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    )
+    return bool(result.scalar())
+
+
+async def index_exists(conn: AsyncConnection, table: str, index: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :index"
+        ),
+        {"table": table, "index": index},
+    )
+    return bool(result.scalar())
@@ -0,0 +1,37 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+VERSION = 1
+DESCRIPTION = "users and jti_blacklist tables"
+
+# IF NOT EXISTS adopts databases created earlier by Base.metadata.create_all
+USERS = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER NOT NULL AUTO_INCREMENT,
+    name VARCHAR(50) NOT NULL,
+    email VARCHAR(100) NOT NULL,
+    phone_no BIGINT,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE INDEX ix_users_email (email),
+    INDEX ix_users_id (id)
+)
+"""
+
+JTI_BLACKLIST = """
+CREATE TABLE IF NOT EXISTS jti_blacklist (
+    id INTEGER NOT NULL AUTO_INCREMENT,
+    jti VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE (jti),
+    INDEX ix_jti_blacklist_id (id)
+)
+"""
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.execute(text(USERS))
+    await conn.execute(text(JTI_BLACKLIST))
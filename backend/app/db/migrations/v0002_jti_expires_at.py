@@ -0,0 +1,17 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.migrations.helpers import column_exists, index_exists
+
+VERSION = 2
+DESCRIPTION = "jti_blacklist.expires_at for purging expired revocations"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # Online DDL: the column is a metadata-only change, the index builds without blocking writes
+    if not await column_exists(conn, "jti_blacklist", "expires_at"):
+        await conn.execute(text("ALTER TABLE jti_blacklist ADD COLUMN expires_at TIMESTAMP NULL, ALGORITHM=INSTANT"))
+    if not await index_exists(conn, "jti_blacklist", "ix_jti_blacklist_expires_at"):
+        await conn.execute(text(
+            "CREATE INDEX ix_jti_blacklist_expires_at ON jti_blacklist (expires_at) ALGORITHM=INPLACE LOCK=NONE"
+        ))
@@ -0,0 +1,14 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.migrations.helpers import column_exists
+
+VERSION = 3
+DESCRIPTION = "users.token_version for logging out every session"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    if not await column_exists(conn, "users", "token_version"):
+        await conn.execute(text(
+            "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0, ALGORITHM=INSTANT"
+        ))
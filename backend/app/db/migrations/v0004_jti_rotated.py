@@ -0,0 +1,14 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.migrations.helpers import column_exists
+
+VERSION = 4
+DESCRIPTION = "jti_blacklist.rotated to tell refresh token reuse from logout"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    if not await column_exists(conn, "jti_blacklist", "rotated"):
+        await conn.execute(text(
+            "ALTER TABLE jti_blacklist ADD COLUMN rotated BOOLEAN NOT NULL DEFAULT FALSE, ALGORITHM=INSTANT"
+        ))
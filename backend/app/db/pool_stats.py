@@ -0,0 +1,124 @@
+import bisect
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram, cheap enough to update on every checkout.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{bound}ms" for bound in self.buckets] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class PoolStats:
+    def __init__(self):
+        self.checkout_wait = Histogram()
+        self.connect_latency = Histogram()
+        self.connection_hold = Histogram()
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def reset(self) -> None:
+        self.checkout_wait.reset()
+        self.connect_latency.reset()
+        self.connection_hold.reset()
+        self.checkouts = 0
+        self.timeouts = 0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records checkout wait, connect latency and
+    connection hold time.
+
+    Checkout wait covers the whole checkout: waiting for a free slot, opening
+    a new connection when the pool grows, and any pre-ping. Hold time runs
+    from leaving the pool until the connection is returned, which is the
+    window a request keeps a slot busy. Stats survive engine.dispose(), which
+    swaps in a recreated pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.checkouts += 1
+            self.stats.checkout_wait.observe((time.perf_counter() - started) * 1000)
+
+    def _do_get(self):
+        record = super()._do_get()
+        record.checked_out_at = time.perf_counter()
+        return record
+
+    def _do_return_conn(self, record):
+        started = getattr(record, "checked_out_at", None)
+        if started is not None:
+            record.checked_out_at = None
+            self.stats.connection_hold.observe((time.perf_counter() - started) * 1000)
+        super()._do_return_conn(record)
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        self.stats.connect_latency.observe((time.perf_counter() - started) * 1000)
+        return record
+
+
+def pool_snapshot(pool: InstrumentedAsyncQueuePool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkouts": pool.stats.checkouts,
+        "timeouts": pool.stats.timeouts,
+        "checkout_wait": pool.stats.checkout_wait.snapshot(),
+        "connect_latency": pool.stats.connect_latency.snapshot(),
+        "connection_hold": pool.stats.connection_hold.snapshot(),
+    }
@@ -0,0 +1,100 @@
+import hashlib
+import hmac
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+# Set on responses after a write; carries the pin to whichever worker serves the next read
+PIN_COOKIE = "rw_pin"
+
+# email -> True while that user's reads must see their own writes (this process only)
+_recent_writers = TTLCache(maxsize=100000)
+
+# (email, until) pins made while handling the current request, see ReadYourWritesMiddleware
+_request_pins: ContextVar[Optional[list]] = ContextVar("_request_pins", default=None)
+
+
+def _signature(email: str, until: int) -> str:
+    key = os.getenv("SECRET_KEY", "").encode()
+    return hmac.new(key, f"{email}|{until}".encode(), hashlib.sha256).hexdigest()
+
+
+def sign_pin(email: str, until: int) -> str:
+    return f"{until}.{_signature(email, until)}"
+
+
+def pin_cookie_valid(email: str, value: Optional[str]) -> bool:
+    """
+    True while a pin cookie issued to this user has not run out.
+    """
+    if not value:
+        return False
+    until, _, signature = value.partition(".")
+    if not until.isdigit() or int(until) <= time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(email, int(until)))
+
+
+def mark_write(email: str) -> None:
+    """
+    Pins the user's reads to the primary for READ_YOUR_WRITES_SECONDS, long
+    enough for the replica to catch up with the write that was just made.
+
+    The in-process pin only covers requests served by this worker. With
+    several workers the guarantee comes from the signed pin cookie set on
+    the response, so it holds only for clients that send cookies back.
+    """
+    if settings.READ_YOUR_WRITES_SECONDS <= 0:
+        return
+
+    until = int(time.time()) + settings.READ_YOUR_WRITES_SECONDS
+    _recent_writers.set(email, True, until)
+
+    pins = _request_pins.get()
+    if pins is not None:
+        pins.append((email, until))
+
+
+def is_pinned_to_primary(email: Optional[str], pin_cookie: Optional[str] = None) -> bool:
+    if email is None:
+        return False
+    return _recent_writers.get(email, False) or pin_cookie_valid(email, pin_cookie)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Adds the signed pin cookie to responses of requests that called mark_write().
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        pins = []
+        token = _request_pins.set(pins)
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and pins and os.getenv("SECRET_KEY"):
+                email, until = pins[-1]
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PIN_COOKIE}={sign_pin(email, until)}; Max-Age={settings.READ_YOUR_WRITES_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_pin)
+        finally:
+            _request_pins.reset(token)
@@ -0,0 +1,121 @@
+import time
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import Row, delete, exists, insert, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.pool_stats import Histogram
+from app.models.jti_blacklist import JTIBlacklist
+from app.models.user import User
+
+# What a request needs to know about the authenticated user; never the password hash.
+# Principal.from_row relies on the first six being in Principal's field order.
+PRINCIPAL_COLUMNS = (User.id, User.name, User.email, User.phone_no, User.created_at, User.updated_at, User.token_version)
+CREDENTIAL_COLUMNS = (User.id, User.email, User.password_hash, User.token_version)
+
+
+class UserRepository:
+    """
+    Every query against the users table, returning Core rows instead of ORM objects.
+
+    The fixed-shape lookups on the auth path are lambda statements: SQLAlchemy
+    builds and compiles them once and afterwards only swaps in the bound
+    parameters. Callers own the transaction; nothing here commits. Each method
+    records its latency under its own name, see stats().
+    """
+
+    def __init__(self):
+        self.latency = defaultdict(Histogram)
+
+    async def _execute(self, db: AsyncSession, name: str, statement):
+        started = time.perf_counter()
+        try:
+            return await db.execute(statement)
+        finally:
+            self.latency[name].observe((time.perf_counter() - started) * 1000)
+
+    async def get_by_email(self, db: AsyncSession, email: str) -> Optional[Row]:
+        statement = lambda_stmt(lambda: select(*PRINCIPAL_COLUMNS).where(User.email == email))
+        result = await self._execute(db, "get_by_email", statement)
+        return result.one_or_none()
+
+    async def get_with_revocation(self, db: AsyncSession, email: str, jti: str) -> tuple[Optional[Row], bool]:
+        """
+        Loads the user and whether the token's JTI is blacklisted in one round trip.
+        """
+        statement = lambda_stmt(lambda: select(
+            *PRINCIPAL_COLUMNS, exists().where(JTIBlacklist.jti == jti).label("revoked")
+        ).where(User.email == email))
+        result = await self._execute(db, "get_with_revocation", statement)
+        row = result.one_or_none()
+
+        if row is None:
+            return None, False
+        return row, bool(row.revoked)
+
+    async def get_with_rotation(self, db: AsyncSession, email: str, jti: str) -> tuple[Optional[Row], Optional[bool]]:
+        """
+        Loads the user and the refresh token's blacklist state in one round trip:
+        None when not blacklisted, True when rotated, False when logged out.
+        """
+        statement = lambda_stmt(lambda: select(
+            *PRINCIPAL_COLUMNS,
+            select(JTIBlacklist.rotated).where(JTIBlacklist.jti == jti).scalar_subquery().label("rotated"),
+        ).where(User.email == email))
+        result = await self._execute(db, "get_with_rotation", statement)
+        row = result.one_or_none()
+
+        if row is None:
+            return None, None
+        return row, None if row.rotated is None else bool(row.rotated)
+
+    async def get_credentials(self, db: AsyncSession, email: str) -> Optional[Row]:
+        statement = lambda_stmt(lambda: select(*CREDENTIAL_COLUMNS).where(User.email == email))
+        result = await self._execute(db, "get_credentials", statement)
+        return result.one_or_none()
+
+    async def list_page(self, db: AsyncSession, columns: list, after_id: int, limit: int) -> list:
+        # Projections vary per request, so this one relies on the regular compiled cache
+        statement = select(*columns).where(User.id > after_id).order_by(User.id).limit(limit)
+        result = await self._execute(db, "list_page", statement)
+        return result.all()
+
+    async def stream_all(self, db: AsyncSession, columns: list, batch_size: int):
+        statement = select(*columns).order_by(User.id).execution_options(yield_per=batch_size)
+        started = time.perf_counter()
+        try:
+            return await db.stream(statement)
+        finally:
+            self.latency["stream_all"].observe((time.perf_counter() - started) * 1000)
+
+    async def create(self, db: AsyncSession, name: str, email: str, phone_no: Optional[int], password_hash: str) -> None:
+        # Nothing is read back: signup only reports success, and a duplicate email
+        # surfaces here as an IntegrityError
+        statement = lambda_stmt(lambda: insert(User).values(
+            name=name, email=email, phone_no=phone_no, password_hash=password_hash
+        ))
+        await self._execute(db, "create", statement)
+
+    async def update_profile(self, db: AsyncSession, user_id: int, values: dict) -> int:
+        statement = update(User).where(User.id == user_id).values(**values)
+        result = await self._execute(db, "update_profile", statement)
+        return result.rowcount
+
+    async def bump_token_version(self, db: AsyncSession, user_id: int) -> int:
+        statement = lambda_stmt(
+            lambda: update(User).where(User.id == user_id).values(token_version=User.token_version + 1)
+        )
+        result = await self._execute(db, "bump_token_version", statement)
+        return result.rowcount
+
+    async def delete(self, db: AsyncSession, user_id: int) -> int:
+        statement = lambda_stmt(lambda: delete(User).where(User.id == user_id))
+        result = await self._execute(db, "delete", statement)
+        return result.rowcount
+
+    def stats(self) -> dict:
+        return {name: histogram.snapshot() for name, histogram in self.latency.items()}
+
+
+user_repository = UserRepository()
@@ -1,36 +1,51 @@
-import uvicorn
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from app.api import api_router
+from app.api.docs import docs
 from app.core.config import settings
 from app.services.logger import logger
-from app.db import initialize_db
+from app.db.migrate import check_schema_version
+from app.auth.hashing import hashing_executor
+from app.services.blacklist_purger import blacklist_purger
+from app.db.health import health_monitor, read_health_monitor
+from app.db.database import engine, read_engine
+from app.db.routing import ReadYourWritesMiddleware
+from app.services.warmup import warmup
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("App is starting... initializing database.")
-    await initialize_db()
-    logger.info("Database initialized")
+    logger.info("App is starting... checking database schema.")
+    # Migrations run separately (python -m app.db.migrate); workers only verify the version
+    version = await check_schema_version()
+    logger.info("Database schema at version %s", version)
+    blacklist_purger.start()
+    health_monitor.start()
+    read_health_monitor.start()
+    if settings.DOCS_ENABLED:
+        docs.build(app)
+    await warmup.run()
     yield
     logger.info("App is shutting down...")
+    await read_health_monitor.stop()
+    await health_monitor.stop()
+    await blacklist_purger.stop()
+    hashing_executor.shutdown()
+    await read_engine.dispose()
+    await engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+# FastAPI's docs routes are replaced by precomputed ones, or dropped with DOCS_ENABLED=False
+app = FastAPI(lifespan=lifespan, openapi_url=None, docs_url=None, redoc_url=None)
 app.include_router(api_router)
-
-
-@app.get("/api/healthcheck")
-async def read_root():
-    logger.info("API Route is working fine!")
-    return {"msg": "The API is LIVE!!"}
-
+# Reads only leave the primary with a replica configured, so only then do writes need a pin cookie
+if settings.ASYNC_REPLICA_DB_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
+if settings.DOCS_ENABLED:
+    docs.install(app)
 
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app", 
-        host=settings.HOST, 
-        port=settings.PORT, 
-        debug=settings.DEBUG
-        )
+    # Same as `python -m app`
+    from app.__main__ import main
+    main()
@@ -1,4 +1,6 @@
-from sqlalchemy import Integer, String, TIMESTAMP
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Boolean, Integer, String, TIMESTAMP, false
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.database import Base
@@ -9,6 +11,10 @@ class JTIBlacklist(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
     jti: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # UTC expiry of the revoked token; the row is useless after this and gets purged
+    expires_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True, index=True)
+    # Set when a refresh rotation used the token up; presenting it again is reuse, not a logout
+    rotated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
 
     created_at: Mapped[TIMESTAMP] = mapped_column(TIMESTAMP, server_default=func.now())
 
@@ -13,6 +13,8 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
     phone_no: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Bumped to revoke every token issued to the user at once
+    token_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     created_at: Mapped[TIMESTAMP] = mapped_column(TIMESTAMP, server_default=func.now())
     updated_at: Mapped[TIMESTAMP] = mapped_column(TIMESTAMP, onupdate=func.now(), server_default=func.now())
@@ -16,7 +16,9 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
-    email: EmailStr 
+    email: EmailStr
 
 
 
+class RefreshToken(BaseModel):
+    refresh_token: str
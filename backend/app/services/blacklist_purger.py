@@ -0,0 +1,101 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import and_, delete, or_
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.models.jti_blacklist import JTIBlacklist
+from app.services.logger import logger
+
+# Rows written before expires_at existed are kept this long after creation
+LEGACY_ROW_RETENTION = timedelta(days=1)
+
+
+class BlacklistPurger:
+    """
+    Background task that deletes JTI blacklist rows whose token has expired.
+
+    Rows are deleted in small batches so a large backlog never holds long locks
+    on jti_blacklist. Counters from every run are kept for the stats endpoint.
+    """
+
+    def __init__(self, interval: int = 300, batch_size: int = 1000):
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.rows_purged = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    async def purge_once(self) -> int:
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expired = or_(
+            JTIBlacklist.expires_at < now,
+            and_(JTIBlacklist.expires_at.is_(None), JTIBlacklist.created_at < now - LEGACY_ROW_RETENTION),
+        )
+        query = delete(JTIBlacklist).where(expired).with_dialect_options(mysql_limit=self.batch_size)
+
+        purged = 0
+        async with AsyncSessionLocal() as session:
+            while True:
+                result = await session.execute(query)
+                await session.commit()
+                purged += result.rowcount
+                if result.rowcount < self.batch_size:
+                    break
+
+        self.runs += 1
+        self.rows_purged += purged
+        self.last_run_at = datetime.now(timezone.utc)
+        self.last_duration_ms = (time.perf_counter() - started) * 1000
+        self.last_error = None
+        logger.info("Purged %d expired JTIs in %.1f ms", purged, self.last_duration_ms)
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error("JTI blacklist purge failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="jti-blacklist-purger")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "rows_purged": self.rows_purged,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_ms": self.last_duration_ms,
+            "last_error": self.last_error,
+        }
+
+
+blacklist_purger = BlacklistPurger(
+    interval=settings.JTI_PURGE_INTERVAL,
+    batch_size=settings.JTI_PURGE_BATCH_SIZE,
+)
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, AsyncReadSessionLocal, engine, read_engine
+from app.db.user_repository import user_repository
+from app.schemas import user as user_schemas
+from app.schemas.item import RefreshToken
+from app.services.logger import logger
+
+# Lookups are read-only; they only exercise the statements
+WARMUP_EMAIL = "warmup@example.com"
+# Throwaway inputs for the validators, never checked against anything
+WARMUP_PASSWORD = "Warm@1234"  # nosec B105
+WARMUP_REFRESH_TOKEN = "warmup"  # nosec B105
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Opens up to `connections` pooled connections at once and returns them to the pool.
+
+    They are held concurrently so the pool really grows; anything beyond the
+    pool size would be discarded on return, so the count is capped there.
+    """
+    count = min(connections, engine.sync_engine.pool.size())
+    if count <= 0:
+        return 0
+
+    results = await asyncio.gather(*(engine.connect().start() for _ in range(count)), return_exceptions=True)
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+    for conn in opened:
+        await conn.close()
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(opened)
+
+
+def warm_validators() -> None:
+    # The first validation of each request model pays one-off setup costs
+    user_schemas.User.model_validate({
+        "name": "Warm Up", "email": WARMUP_EMAIL, "phone_no": 1234567890, "password": WARMUP_PASSWORD,
+    })
+    user_schemas.Login.model_validate({"email": WARMUP_EMAIL, "password": WARMUP_PASSWORD})
+    user_schemas.Update_user.model_validate({"name": "Warm Up", "phone_no": 1234567890})
+    RefreshToken.model_validate({"refresh_token": WARMUP_REFRESH_TOKEN})
+
+
+async def warm_statements() -> None:
+    # Running the read lookups compiles them into each engine's statement cache
+    async with AsyncReadSessionLocal() as session:
+        await user_repository.get_with_revocation(session, WARMUP_EMAIL, "warmup")
+        await user_repository.get_by_email(session, WARMUP_EMAIL)
+    async with AsyncSessionLocal() as session:
+        await user_repository.get_credentials(session, WARMUP_EMAIL)
+        await user_repository.get_with_rotation(session, WARMUP_EMAIL, "warmup")
+        await user_repository.get_by_email(session, WARMUP_EMAIL)
+
+
+class Warmup:
+    """
+    Startup warmup that gates the readiness probe.
+
+    Prewarms both connection pools, then validators and compiled SQL. A failed
+    validator or statement step is logged and skipped: the worker just pays
+    that cold-start cost on its first requests. A failed pool step means the
+    database is unreachable, so the worker starts degraded instead of ready
+    and the readiness probe waits for the database to answer.
+    """
+
+    def __init__(self, pool_connections: int = 5):
+        self.pool_connections = pool_connections
+
+        self.ready = False
+        self.degraded = False
+        self.connections_opened = 0
+        self.duration_ms: Optional[float] = None
+        self.errors: list = []
+
+    async def run(self) -> None:
+        started = time.perf_counter()
+        self.errors = []
+        failed = set()
+
+        for name, step in (
+            ("pool", self._prewarm_pools),
+            ("validators", self._warm_validators),
+            ("statements", warm_statements),
+        ):
+            try:
+                await step()
+            except Exception as e:
+                logger.warning("Warmup step %s failed: %s", name, e)
+                self.errors.append(f"{name}: {e}")
+                failed.add(name)
+
+        self.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        self.degraded = "pool" in failed
+        self.ready = not self.degraded
+        if self.degraded:
+            logger.warning("Worker started degraded after %.1f ms: database unreachable", self.duration_ms)
+        else:
+            logger.info("Worker warm in %.1f ms (%s pooled connections)", self.duration_ms, self.connections_opened)
+
+    def recovered(self) -> None:
+        self.degraded = False
+        self.ready = True
+        logger.info("Database reachable again, worker is ready")
+
+    async def _prewarm_pools(self) -> None:
+        opened = await asyncio.gather(
+            prewarm_pool(engine, self.pool_connections),
+            prewarm_pool(read_engine, self.pool_connections),
+        )
+        self.connections_opened = sum(opened)
+
+    async def _warm_validators(self) -> None:
+        warm_validators()
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "degraded": self.degraded,
+            "connections_opened": self.connections_opened,
+            "duration_ms": self.duration_ms,
+            "errors": self.errors,
+        }
+
+
+warmup = Warmup(pool_connections=settings.DB_POOL_PREWARM)
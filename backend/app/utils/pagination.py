@@ -0,0 +1,22 @@
+import base64
+import binascii
+from typing import Optional
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Opaque keyset cursor: the last id of the page, base64url without padding.
+    """
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """
+    Returns the id to continue after, or None if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = int(raw.decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return last_id if last_id >= 0 else None
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+from app.models.user import User
+
+# Columns a client may ask for; password_hash and token_version are never exposed
+USER_FIELDS = {
+    "id": User.id,
+    "name": User.name,
+    "email": User.email,
+    "phone_no": User.phone_no,
+    "created_at": User.created_at,
+    "updated_at": User.updated_at,
+}
+
+
+def parse_fields(fields: Optional[str]) -> list:
+    """
+    Turns a comma-separated `fields=` value into field names, all fields when omitted.
+    Raises ValueError on unknown or empty selections.
+    """
+    if fields is None:
+        return list(USER_FIELDS)
+
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in USER_FIELDS]
+    if unknown or not names:
+        raise ValueError(
+            f"Invalid fields: {', '.join(unknown) or fields!r}. "
+            f"Allowed: {', '.join(USER_FIELDS)}"
+        )
+    return names
+
+
+def user_columns(names: list) -> list:
+    return [USER_FIELDS[name] for name in names]
+
+
+def project(source, names: list) -> dict:
+    """
+    Builds the response dict from a Core row or any object with matching attributes.
+    """
+    data = {}
+    for name in names:
+        value = getattr(source, name)
+        data[name] = value.isoformat() if isinstance(value, datetime) else value
+    return data
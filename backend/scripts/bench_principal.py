@@ -0,0 +1,92 @@
+# backend/scripts/bench_principal.py
+#
+# Compares the per-request cost of the old user.__dict__ copy with building the
+# Principal from the Core row the user repository returns, and with the same
+# fields in a frozen dataclass, the shape Principal was chosen over.
+# Run from backend/:  PYTHONPATH=. python scripts/bench_principal.py
+
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.engine.result import result_tuple
+
+import app.db  # noqa: F401  (loads the models before the auth modules)
+from app.auth.principal import Principal
+from app.db.user_repository import PRINCIPAL_COLUMNS
+from app.models.user import User
+
+ITERATIONS = 200000
+
+user = User(
+    id=1,
+    name="Bench User",
+    email="bench@example.com",
+    phone_no=1234567890,
+    password_hash="$2b$12$" + "x" * 53,
+    created_at=datetime(2024, 1, 1),
+    updated_at=datetime(2024, 1, 2),
+)
+
+# The same user as a Row of PRINCIPAL_COLUMNS, as get_with_revocation returns it
+row = result_tuple([column.key for column in PRINCIPAL_COLUMNS])(
+    (user.id, user.name, user.email, user.phone_no, user.created_at, user.updated_at, 0)
+)
+
+
+def build_dict():
+    user_dict = user.__dict__.copy()
+    user_dict.update({"token": "token", "jti": "jti", "exp": 1700000000})
+    return user_dict
+
+
+def build_principal():
+    return Principal.from_row(row, jti="jti", exp=1700000000)
+
+
+@dataclass(frozen=True)
+class FrozenPrincipal:
+    id: int
+    name: str
+    email: str
+    phone_no: Optional[int]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    jti: str
+    exp: int
+    refresh_jti: Optional[str] = None
+
+
+def build_dataclass():
+    return FrozenPrincipal(*row[:6], "jti", 1700000000, None)
+
+
+def allocated_bytes(factory) -> int:
+    tracemalloc.start()
+    objects = [factory() for _ in range(1000)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size // 1000
+
+
+def main():
+    builders = {"dict": build_dict, "Principal": build_principal, "dataclass": build_dataclass}
+    built = {name: build() for name, build in builders.items()}
+
+    print(f"{'':12}" + "".join(f"{name:>13}" for name in builders))
+    print(f"{'build':12}" + "".join(
+        f"{timeit.timeit(build, number=ITERATIONS) / ITERATIONS * 1e9:10.0f} ns" for build in builders.values()
+    ))
+    readers = [lambda: built["dict"]["email"], lambda: built["Principal"].email, lambda: built["dataclass"].email]
+    print(f"{'read email':12}" + "".join(
+        f"{timeit.timeit(read, number=ITERATIONS) / ITERATIONS * 1e9:10.0f} ns" for read in readers
+    ))
+    print(f"{'getsizeof':12}" + "".join(f"{sys.getsizeof(value):11d} B" for value in built.values()))
+    print(f"{'allocated':12}" + "".join(f"{allocated_bytes(build):11d} B" for build in builders.values()))
+
+if __name__ == "__main__":
+    main()
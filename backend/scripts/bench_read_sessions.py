@@ -0,0 +1,69 @@
+# backend/scripts/bench_read_sessions.py
+#
+# Compares a user lookup on the primary session (REPEATABLE READ, rolled back on
+# return) with the read session (READ_ISOLATION_LEVEL, AUTOCOMMIT by default).
+# Needs the configured MySQL and at least one user row.
+# Run from backend/:  PYTHONPATH=. python scripts/bench_read_sessions.py
+
+import asyncio
+import time
+
+from sqlalchemy import event, select
+
+import app.db  # noqa: F401  (loads the models before the auth modules)
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, AsyncReadSessionLocal, engine, read_engine
+from app.models.user import User
+
+ITERATIONS = 2000
+
+
+class RoundTrips:
+    def __init__(self, async_engine):
+        self.statements = 0
+        self.resets = 0
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(async_engine.sync_engine.pool, "reset", self._on_reset)
+
+    def _on_execute(self, *args):
+        self.statements += 1
+
+    def _on_reset(self, *args):
+        self.resets += 1
+
+
+async def _time_lookup(session_factory, email: str) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        async with session_factory() as session:
+            result = await session.execute(select(User).where(User.email == email))
+            result.scalar_one_or_none()
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main():
+    async with AsyncSessionLocal() as session:
+        email = (await session.execute(select(User.email).limit(1))).scalar_one_or_none()
+    if email is None:
+        print("No users found; sign up at least one user first")
+        return
+
+    primary_trips = RoundTrips(engine)
+    read_trips = RoundTrips(read_engine)
+
+    primary = await _time_lookup(AsyncSessionLocal, email)
+    read = await _time_lookup(AsyncReadSessionLocal, email)
+
+    print(f"primary session: {primary:8.2f} us/lookup, "
+          f"{primary_trips.statements / ITERATIONS:.2f} statements + {primary_trips.resets / ITERATIONS:.2f} rollbacks")
+    print(f"read session:    {read:8.2f} us/lookup, "
+          f"{read_trips.statements / ITERATIONS:.2f} statements + {read_trips.resets / ITERATIONS:.2f} rollbacks "
+          f"({settings.READ_ISOLATION_LEVEL})")
+    print(f"saved:           {primary - read:8.2f} us/lookup")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
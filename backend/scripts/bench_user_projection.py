@@ -0,0 +1,77 @@
+# backend/scripts/bench_user_projection.py
+#
+# Compares a page of the user listing loaded as ORM objects (the old select(User))
+# with Core rows of the projected columns: rows/sec and bytes sent by the server.
+# Needs the configured MySQL with some users in it.
+# Run from backend/:  PYTHONPATH=. python scripts/bench_user_projection.py
+
+import asyncio
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db  # noqa: F401  (loads the models before the auth modules)
+from app.db.database import engine
+from app.models.user import User
+from app.utils.projection import parse_fields, user_columns, project
+
+ITERATIONS = 200
+PAGE_SIZE = 500
+
+
+def orm_page(result) -> list:
+    return [{
+        "id": u.id,
+        "name": u.name,
+        "email": u.email,
+        "phone_no": u.phone_no,
+        "created_at": u.created_at.isoformat() if u.created_at else None,
+        "updated_at": u.updated_at.isoformat() if u.updated_at else None
+    } for u in result.scalars().all()]
+
+
+async def _bytes_sent(session: AsyncSession) -> int:
+    result = await session.execute(text("SHOW SESSION STATUS LIKE 'Bytes_sent'"))
+    return int(result.one()[1])
+
+
+async def _run(session: AsyncSession, label: str, query, build) -> None:
+    rows = 0
+    sent_before = await _bytes_sent(session)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        rows += len(build(await session.execute(query)))
+        session.expunge_all()
+    elapsed = time.perf_counter() - started
+    # Each SHOW STATUS reply is counted too; it is tiny next to a page of users
+    sent = await _bytes_sent(session) - sent_before
+
+    print(f"{label:<24} {rows / elapsed:12,.0f} rows/sec {sent / max(rows, 1):10.1f} bytes/row")
+
+
+async def main():
+    all_fields = parse_fields(None)
+    few_fields = parse_fields("id,email")
+
+    # One connection, so SHOW SESSION STATUS sees every byte of the runs
+    async with engine.connect() as conn:
+        session = AsyncSession(bind=conn)
+        await _run(session, "ORM select(User)", select(User).order_by(User.id).limit(PAGE_SIZE), orm_page)
+        await _run(
+            session, "Core, all fields",
+            select(*user_columns(all_fields)).order_by(User.id).limit(PAGE_SIZE),
+            lambda result: [project(row, all_fields) for row in result.all()],
+        )
+        await _run(
+            session, "Core, fields=id,email",
+            select(*user_columns(few_fields)).order_by(User.id).limit(PAGE_SIZE),
+            lambda result: [project(row, few_fields) for row in result.all()],
+        )
+        await session.close()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
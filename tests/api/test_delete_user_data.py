@@ -87,3 +87,41 @@ async def test_delete_user_token_missing_email(test_client, monkeypatch):
     assert data["detail"] == "Could not validate credentials"
 
 
+
+
+# Query count: the delete is one statement, 404 is decided from its rowcount
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rowcount, status_code", [(1, 200), (0, 404)])
+async def test_delete_user_single_statement(test_client, rowcount, status_code):
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.auth.jwt_handler import get_current_user
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session, make_principal
+
+    session = mock_write_session(rowcount)
+    app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_current_user] = make_principal
+    try:
+        response = await test_client.delete("/api/users/delete-data")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == status_code
+    assert session.execute.await_count == 1
+
+
+# Tokens of a deleted account do not authenticate a new account with the same email
+@pytest.mark.asyncio
+async def test_old_token_rejected_after_resignup(test_client):
+    email = "delete_resignup@example.com"
+    old_token = await create_user_and_get_token(test_client, email=email)
+
+    response = await test_client.delete("/api/users/delete-data", headers={"Authorization": f"Bearer {old_token}"})
+    assert response.status_code == 200
+
+    new_token = await create_user_and_get_token(test_client, email=email)
+    assert (await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {new_token}"})).status_code == 200
+
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {old_token}"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
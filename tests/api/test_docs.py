@@ -0,0 +1,93 @@
+import gzip
+import json
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+
+# OpenAPI JSON: precomputed, gzipped on request, revalidated by ETag
+@pytest.mark.asyncio
+async def test_openapi_served_precomputed(test_client):
+    response = await test_client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    schema = response.json()
+    assert "/api/users/login" in schema["paths"]
+    assert "/openapi.json" not in schema["paths"]
+
+    etag = response.headers["etag"]
+    response = await test_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+@pytest.mark.asyncio
+async def test_openapi_gzip(test_client):
+    from app.api.docs import docs  # same module instance the routes use
+
+    response = await test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    # httpx decodes transparently; the wire bytes are the cached gzip body
+    assert json.loads(gzip.decompress(docs.openapi.gzipped)) == response.json()
+
+# q=0 refuses an encoding, so those clients get the identity body
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept_encoding, gzipped", [
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, identity", False),
+    ("br, gzip;q=0, *;q=1", False),
+    ("*;q=0", False),
+    ("gzip;q=0.5", True),
+    ("GZIP", True),
+    ("br, *", True),
+])
+async def test_openapi_gzip_q_values(test_client, accept_encoding, gzipped):
+    response = await test_client.get("/openapi.json", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    assert ("content-encoding" in response.headers) is gzipped
+    assert response.headers["etag"].endswith('-gz"') is gzipped
+    assert "/api/users/login" in response.json()["paths"]
+
+# Each encoding has its own ETag; either one revalidates
+@pytest.mark.asyncio
+async def test_etag_per_encoding(test_client):
+    identity = await test_client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    gzipped = await test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["etag"] == identity.headers["etag"][:-1] + '-gz"'
+    for etag in (identity.headers["etag"], gzipped.headers["etag"]):
+        response = await test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == gzipped.headers["etag"]
+
+@pytest.mark.asyncio
+async def test_docs_pages(test_client):
+    for url in ("/docs", "/redoc"):
+        response = await test_client.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "/openapi.json" in response.text
+
+    response = await test_client.get("/docs")
+    assert "/docs/oauth2-redirect" in response.text
+
+    response = await test_client.get("/docs/oauth2-redirect")
+    assert response.status_code == 200
+    assert "oauth2" in response.text
+
+# Disabled docs: without install() the app has no schema or UI routes at all
+@pytest.mark.asyncio
+async def test_docs_only_when_installed():
+    from backend.app.api import api_router
+    from backend.app.api.docs import PrecomputedDocs
+
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    app.include_router(api_router)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for url in ("/openapi.json", "/docs", "/redoc"):
+            assert (await client.get(url)).status_code == 404
+
+        PrecomputedDocs().install(app)
+        for url in ("/openapi.json", "/docs", "/redoc"):
+            assert (await client.get(url)).status_code == 200
@@ -0,0 +1,92 @@
+import json
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from tests.api.utils import create_user_and_get_token
+
+
+# Success: Export streams one JSON object per line
+@pytest.mark.asyncio
+async def test_export_users_success(test_client):
+    token = await create_user_and_get_token(test_client, email="export@example.com")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await test_client.get("/api/users/export", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    users = [json.loads(line) for line in response.text.splitlines()]
+    assert any(user["email"] == "export@example.com" for user in users)
+    assert all("password_hash" not in user for user in users)
+    assert [user["id"] for user in users] == sorted(user["id"] for user in users)
+
+# Unauthorized: Missing token
+@pytest.mark.asyncio
+async def test_export_users_missing_token(test_client):
+    response = await test_client.get("/api/users/export")
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Not authenticated"
+
+
+# Batches from the server-side cursor are yielded one chunk at a time
+@pytest.mark.asyncio
+async def test_stream_users_yields_batches():
+    from backend.app.api.endpoints import export_users
+
+    def row(i):
+        return SimpleNamespace(id=i, name=f"User {i}", email=f"user{i}@example.com", phone_no=None,
+                               created_at=datetime(2024, 1, 1), updated_at=None)
+
+    async def partitions():
+        yield [row(1), row(2)]
+        yield [row(3)]
+
+    result = MagicMock()
+    result.partitions.return_value = partitions()
+    session = AsyncMock()
+    session.stream.return_value = result
+    session.__aenter__.return_value = session
+
+    chunks = [chunk async for chunk in export_users.stream_users(
+        batch_size=2, names=["id", "created_at"], session_factory=MagicMock(return_value=session))]
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+    assert json.loads(lines[0])["created_at"] == "2024-01-01T00:00:00"
+
+    query = session.stream.await_args.args[0]
+    assert query.get_execution_options()["yield_per"] == 2
+
+
+# A client pinned to the primary by a recent write exports from the primary, not the replica
+@pytest.mark.asyncio
+async def test_export_users_pinned_client_reads_primary():
+    from backend.app.api.endpoints import export_users
+    from backend.app.auth.principal import Principal
+
+    async def partitions():
+        yield []
+
+    result = MagicMock()
+    result.partitions.return_value = partitions()
+    primary = AsyncMock()
+    primary.stream.return_value = result
+    primary.__aenter__.return_value = primary
+
+    request = SimpleNamespace(state=SimpleNamespace(principal_email="writer@example.com"), cookies={"rw_pin": "pin"})
+    current_user = Principal(id=1, name="Writer", email="writer@example.com", phone_no=None,
+                             created_at=datetime(2024, 1, 1), updated_at=None, jti="j", exp=0)
+
+    with patch.object(export_users, "reads_from_primary", return_value=True) as pinned, \
+         patch.object(export_users, "AsyncSessionLocal", return_value=primary), \
+         patch.object(export_users, "AsyncReadSessionLocal") as replica:
+        response = await export_users.export_users(request, fields=None, current_user=current_user)
+        _ = [chunk async for chunk in response.body_iterator]
+
+    pinned.assert_called_once_with(request)
+    primary.stream.assert_awaited_once()
+    replica.assert_not_called()
@@ -0,0 +1,76 @@
+import logging
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+# Liveness: always answers, without touching the database or the log
+@pytest.mark.asyncio
+async def test_liveness(test_client, caplog):
+    with caplog.at_level(logging.DEBUG, logger="app"):
+        live = await test_client.get("/api/live")
+        healthcheck = await test_client.get("/api/healthcheck")
+
+    assert live.status_code == 200
+    assert live.json() == {"status": "live"}
+    assert healthcheck.json() == {"msg": "The API is LIVE!!"}
+    assert [record for record in caplog.records if record.name == "app"] == []
+
+# Readiness: 503 until the worker is warm, 200 afterwards
+@pytest.mark.asyncio
+async def test_readiness_follows_warmup(test_client):
+    from app.services.warmup import warmup  # same module instance the routes use
+
+    warmup.ready = False
+    response = await test_client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    warmup.ready = True
+    try:
+        response = await test_client.get("/api/ready")
+    finally:
+        warmup.ready = False
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "ready": True}
+
+# Deep readiness: reflects the cached DB check
+@pytest.mark.asyncio
+async def test_deep_readiness(test_client):
+    from app.services.warmup import warmup  # same module instances the routes use
+    from app.db.health import deep_health_check
+
+    warmup.ready = True
+    try:
+        with patch.object(deep_health_check, "check", AsyncMock(return_value=False)):
+            down = await test_client.get("/api/ready", params={"deep": "true"})
+            shallow = await test_client.get("/api/ready")
+        with patch.object(deep_health_check, "check", AsyncMock(return_value=True)):
+            up = await test_client.get("/api/ready", params={"deep": "true"})
+    finally:
+        warmup.ready = False
+
+    assert down.status_code == 503
+    assert down.json()["status"] == "db_unavailable"
+    assert shallow.status_code == 200
+    assert up.status_code == 200
+
+# Degraded: a worker whose pool warmup failed is ready only once the database answers
+@pytest.mark.asyncio
+async def test_degraded_worker_waits_for_database(test_client):
+    from app.services.warmup import warmup  # same module instances the routes use
+    from app.db.health import deep_health_check
+
+    warmup.ready, warmup.degraded = False, True
+    try:
+        with patch.object(deep_health_check, "check", AsyncMock(return_value=False)):
+            down = await test_client.get("/api/ready")
+        with patch.object(deep_health_check, "check", AsyncMock(return_value=True)):
+            up = await test_client.get("/api/ready")
+        recovered = warmup.ready
+    finally:
+        warmup.ready, warmup.degraded = False, False
+
+    assert down.status_code == 503
+    assert down.json() == {"status": "degraded", "ready": False}
+    assert up.status_code == 200
+    assert recovered is True
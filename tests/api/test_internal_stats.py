@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.fixture
+def stats_token(monkeypatch):
+    from app.core.config import settings  # same module instance the route reads
+
+    monkeypatch.setattr(settings, "STATS_TOKEN", "stats-secret")
+    return {"X-Stats-Token": "stats-secret"}
+
+
+# Stats endpoint reports pool, caches and background tasks without touching the DB
+@pytest.mark.asyncio
+async def test_internal_stats(test_client, stats_token):
+    response = await test_client.get("/api/internal/stats", headers=stats_token)
+    data = response.json()
+
+    assert response.status_code == 200
+    assert set(data) == {"pool", "read_pool", "db_health", "read_db_health", "hashing", "jti_blacklist_cache", "token_cache", "jti_blacklist_purge", "user_queries", "warmup"}
+    assert "checked_out" in data["pool"]
+    assert "buckets" in data["pool"]["checkout_wait"]
+    assert "hits" in data["token_cache"]
+    assert "rows_purged" in data["jti_blacklist_purge"]
+
+
+# Unauthorized: a missing or wrong token is rejected
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{}, {"X-Stats-Token": "wrong"}])
+async def test_internal_stats_requires_token(test_client, stats_token, headers):
+    response = await test_client.get("/api/internal/stats", headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid stats token"
+
+
+# Not Found: without STATS_TOKEN the endpoint is off, even for a guessed header
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{}, {"X-Stats-Token": ""}])
+async def test_internal_stats_disabled_by_default(test_client, monkeypatch, headers):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "STATS_TOKEN", "")
+    response = await test_client.get("/api/internal/stats", headers=headers)
+    assert response.status_code == 404
+
+
+# Internal endpoints stay out of the public OpenAPI document
+@pytest.mark.asyncio
+async def test_internal_stats_not_in_schema(test_client):
+    response = await test_client.get("/openapi.json")
+    assert "/api/internal/stats" not in response.json()["paths"]
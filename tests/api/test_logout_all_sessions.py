@@ -0,0 +1,47 @@
+import pytest
+from tests.api.utils import create_user_and_get_token
+
+
+# Success: Every token of the user is revoked
+@pytest.mark.asyncio
+async def test_logout_all_sessions_success(test_client):
+    email = "logout_all@example.com"
+    first_token = await create_user_and_get_token(test_client, email=email)
+    second_token = await create_user_and_get_token(test_client, email=email)
+
+    response = await test_client.post("/api/users/log-out-all", headers={"Authorization": f"Bearer {first_token}"})
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data == {
+        "msg": "User logged out from all sessions",
+        "status": True
+    }
+
+    for token in (first_token, second_token):
+        response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+
+
+# New logins after logout-all work again
+@pytest.mark.asyncio
+async def test_logout_all_sessions_new_login_allowed(test_client):
+    email = "logout_all_relogin@example.com"
+    token = await create_user_and_get_token(test_client, email=email)
+
+    await test_client.post("/api/users/log-out-all", headers={"Authorization": f"Bearer {token}"})
+
+    new_token = await create_user_and_get_token(test_client, email=email)
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {new_token}"})
+    assert response.status_code == 200
+
+
+# Unauthorized: Missing token
+@pytest.mark.asyncio
+async def test_logout_all_sessions_missing_token(test_client):
+    response = await test_client.post("/api/users/log-out-all")
+    data = response.json()
+
+    assert response.status_code == 401
+    assert data["detail"] == "Not authenticated"
@@ -116,3 +116,51 @@ async def test_logout_user_duplicate_jti(test_client):
 
     assert response2.status_code == 401
     assert data["detail"] == "Token has been revoked"
+
+
+# Logout revokes the refresh token issued with the access token
+@pytest.mark.asyncio
+async def test_logout_revokes_refresh_token(test_client):
+    from tests.api.test_refresh_token import login_and_get_tokens
+
+    token, refresh_token = await login_and_get_tokens(test_client, "logout_refresh@example.com")
+    other_session = (await test_client.post(
+        "/api/users/login", json={"email": "logout_refresh@example.com", "password": "Test@123"}
+    )).json()["token"]
+
+    response = await test_client.post("/api/users/log-out", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+
+    response = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token has been revoked"
+
+    # A retry after logout is not reuse: the user's other sessions stay valid
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {other_session}"})
+    assert response.status_code == 200
+
+
+# Query count: both JTIs are blacklisted in one statement
+@pytest.mark.asyncio
+async def test_logout_blacklists_token_pair_in_one_statement(test_client):
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.auth.jwt_handler import get_current_user, blacklist_cache
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session, make_principal
+
+    principal = make_principal()._replace(jti="logout-access-jti", refresh_jti="logout-refresh-jti")
+    session = mock_write_session()
+    app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_current_user] = lambda: principal
+    try:
+        response = await test_client.post("/api/users/log-out")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert session.execute.await_count == 1
+    statement = session.execute.await_args.args[0]
+    compiled = statement.compile()
+    assert "IGNORE" in str(compiled)
+    assert {"logout-access-jti", "logout-refresh-jti"} <= set(compiled.params.values())
+    assert blacklist_cache.get("logout-refresh-jti") is True
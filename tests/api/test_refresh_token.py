@@ -0,0 +1,185 @@
+import pytest
+from tests.conftest import register_test_email
+
+
+async def login_and_get_tokens(test_client, email, password="Test@123"):
+    signup_payload = {
+        "name": "Refresh User",
+        "email": email,
+        "phone_no": 1234567890,
+        "password": password
+    }
+
+    await register_test_email(email)
+    await test_client.post("/api/users/signup", json=signup_payload)
+
+    response = await test_client.post("/api/users/login", json={"email": email, "password": password})
+    data = response.json()
+    return data["token"], data["refresh_token"]
+
+
+# Success: Refresh returns a new token pair
+@pytest.mark.asyncio
+async def test_refresh_token_success(test_client):
+    token, refresh_token = await login_and_get_tokens(test_client, "refresh_success@example.com")
+
+    response = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["status"] is True
+    assert data["msg"] == "Token refreshed successfully"
+    assert data["refresh_token"] != refresh_token
+
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {data['token']}"})
+    assert response.status_code == 200
+
+
+# Reuse: A rotated refresh token is rejected and ends every session
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_sessions(test_client):
+    token, refresh_token = await login_and_get_tokens(test_client, "refresh_reuse@example.com")
+
+    first = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    assert first.status_code == 200
+
+    second = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    assert second.status_code == 401
+    assert second.json()["detail"] == "Refresh token has been revoked"
+
+    rotated_token = first.json()["token"]
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {rotated_token}"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+# Unauthorized: Refresh token cannot be used as an access token
+@pytest.mark.asyncio
+async def test_refresh_token_rejected_as_access_token(test_client):
+    _, refresh_token = await login_and_get_tokens(test_client, "refresh_as_access@example.com")
+
+    response = await test_client.get("/api/users/me", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+
+# Unauthorized: Access token cannot be used as a refresh token
+@pytest.mark.asyncio
+async def test_access_token_rejected_by_refresh(test_client):
+    from backend.app.auth.jwt_handler import create_access_token
+
+    token = await create_access_token({"email": "not_a_refresh@example.com"})
+
+    response = await test_client.post("/api/users/refresh", json={"refresh_token": token})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+
+# Unauthorized: Invalid refresh token
+@pytest.mark.asyncio
+async def test_refresh_token_invalid(test_client):
+    response = await test_client.post("/api/users/refresh", json={"refresh_token": "invalid.token.here"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+
+# Missing body field
+@pytest.mark.asyncio
+async def test_refresh_token_missing_field(test_client):
+    response = await test_client.post("/api/users/refresh", json={})
+    assert response.status_code == 422
+
+
+# Race: the request that loses the rotation to a concurrent one also revokes every session
+@pytest.mark.asyncio
+async def test_concurrent_refresh_reuse_revokes_sessions(test_client, monkeypatch):
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from sqlalchemy.exc import IntegrityError
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.api.endpoints import refresh_token as endpoint
+    from app.auth.jwt_handler import create_token_pair
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session
+
+    email = "refresh_race@example.com"
+    _, refresh_token = await create_token_pair(email, 0, 7)
+    user = SimpleNamespace(id=7, email=email, token_version=0)
+    monkeypatch.setattr(endpoint.user_repository, "get_with_rotation", AsyncMock(return_value=(user, None)))
+    bump = AsyncMock(return_value=1)
+    monkeypatch.setattr(endpoint.user_repository, "bump_token_version", bump)
+
+    # The blacklist INSERT hits the unique JTI another request inserted first
+    session = mock_write_session()
+    session.commit.side_effect = [IntegrityError("INSERT", {}, Exception("Duplicate entry")), None]
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        response = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token has been revoked"
+    session.rollback.assert_awaited_once()
+    bump.assert_awaited_once_with(session, user.id)
+    assert session.commit.await_count == 2
+
+
+# A refresh token issued before the account was deleted cannot refresh the re-created account
+@pytest.mark.asyncio
+async def test_refresh_token_for_deleted_account_rejected(test_client, monkeypatch):
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.api.endpoints import refresh_token as endpoint
+    from app.auth.jwt_handler import create_token_pair
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session
+
+    email = "refresh_recreated@example.com"
+    _, refresh_token = await create_token_pair(email, 0, 7)
+    # Same email and token_version, new row id
+    recreated = SimpleNamespace(id=8, email=email, token_version=0)
+    monkeypatch.setattr(endpoint.user_repository, "get_with_rotation", AsyncMock(return_value=(recreated, None)))
+
+    session = mock_write_session()
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        response = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token has been revoked"
+    session.commit.assert_not_awaited()
+
+
+# Blacklist state: reuse of a rotated token ends every session, a logged-out token only gets a 401
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rotated, bumped", [(True, True), (False, False)])
+async def test_revoked_refresh_token(test_client, monkeypatch, rotated, bumped):
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.api.endpoints import refresh_token as endpoint
+    from app.auth.jwt_handler import create_token_pair
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session
+
+    email = "refresh_revoked@example.com"
+    _, refresh_token = await create_token_pair(email, 0, 7)
+    user = SimpleNamespace(id=7, email=email, token_version=0)
+    monkeypatch.setattr(endpoint.user_repository, "get_with_rotation", AsyncMock(return_value=(user, rotated)))
+    bump = AsyncMock(return_value=1)
+    monkeypatch.setattr(endpoint.user_repository, "bump_token_version", bump)
+
+    session = mock_write_session()
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        response = await test_client.post("/api/users/refresh", json={"refresh_token": refresh_token})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token has been revoked"
+    assert bump.await_count == (1 if bumped else 0)
@@ -181,3 +181,28 @@ async def test_signup_invalid_phone_string(test_client):
 
     assert response.status_code == 422
     assert "detail" in data
+
+
+# Query count: signup is a single INSERT with no read-back
+@pytest.mark.asyncio
+async def test_signup_single_statement(test_client):
+    from app.db.dependencies import get_db  # same module instance the routes depend on
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session
+
+    session = mock_write_session()
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        response = await test_client.post("/api/users/signup", json={
+            "name": "Counted User",
+            "email": "counted@example.com",
+            "phone_no": 1234567890,
+            "password": "Test@123"
+        })
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 201
+    assert session.execute.await_count == 1
+    session.refresh.assert_not_awaited()
+    session.commit.assert_awaited_once()
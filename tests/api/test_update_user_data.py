@@ -127,3 +127,24 @@ async def test_update_user_token_missing_email(test_client, monkeypatch):
 
 
 
+
+
+# Query count: the update is one statement, 404 is decided from its rowcount
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rowcount, status_code", [(1, 200), (0, 404)])
+async def test_update_user_single_statement(test_client, rowcount, status_code):
+    from app.db.dependencies import get_db  # same module instances the routes depend on
+    from app.auth.jwt_handler import get_current_user
+    from backend.app.main import app
+    from tests.api.utils import mock_write_session, make_principal
+
+    session = mock_write_session(rowcount)
+    app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_current_user] = make_principal
+    try:
+        response = await test_client.put("/api/users/update-data", json={"name": "Renamed User"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == status_code
+    assert session.execute.await_count == 1
@@ -68,4 +68,107 @@ async def test_get_current_user_not_found_in_db(test_client, db_session):
     data = response.json()
 
     assert response.status_code == 404
-    assert data["detail"] == "User not found"
\ No newline at end of file
+    assert data["detail"] == "User not found"
+
+
+# Invalid-token floods are rejected before a DB session is opened
+@pytest.mark.asyncio
+async def test_invalid_tokens_do_not_open_db_sessions(test_client):
+    from app.db.dependencies import get_db  # same module instance the routes depend on
+    from backend.app.main import app
+
+    sessions_opened = 0
+
+    async def counting_get_db():
+        nonlocal sessions_opened
+        sessions_opened += 1
+        yield None
+
+    app.dependency_overrides[get_db] = counting_get_db
+    try:
+        for _ in range(20):
+            response = await test_client.get("/api/users/", headers={"Authorization": "Bearer invalid.token.here"})
+            assert response.status_code == 401
+            response = await test_client.get("/api/users/me", headers={"Authorization": "Bearer invalid.token.here"})
+            assert response.status_code == 401
+    finally:
+        app.dependency_overrides.clear()
+
+    assert sessions_opened == 0
+
+
+# Pagination: pages follow the cursor until next_cursor is null
+@pytest.mark.asyncio
+async def test_get_all_users_paginated(test_client):
+    emails = [f"page{i}@example.com" for i in range(3)]
+    for email in emails:
+        token = await create_user_and_get_token(test_client, email=email)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await test_client.get("/api/users/", headers=headers, params=params)
+        data = response.json()
+
+        assert response.status_code == 200
+        assert len(data["data"]) <= 2
+        seen.extend(user["id"] for user in data["data"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen))
+    assert len(seen) >= len(emails)
+
+# Bad Request: Malformed cursor
+@pytest.mark.asyncio
+async def test_get_all_users_invalid_cursor(test_client):
+    token = await create_user_and_get_token(test_client)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await test_client.get("/api/users/", headers=headers, params={"cursor": "!!!"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+# Unprocessable: Page size above the hard maximum
+@pytest.mark.asyncio
+async def test_get_all_users_limit_above_max(test_client):
+    from backend.app.core.config import settings
+
+    token = await create_user_and_get_token(test_client)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await test_client.get("/api/users/", headers=headers, params={"limit": settings.USERS_MAX_PAGE_SIZE + 1})
+
+    assert response.status_code == 422
+
+# Projection: only the requested columns come back, the cursor still works
+@pytest.mark.asyncio
+async def test_get_all_users_fields(test_client):
+    for i in range(2):
+        token = await create_user_and_get_token(test_client, email=f"fields{i}@example.com")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await test_client.get("/api/users/", headers=headers, params={"fields": "email", "limit": 1})
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["data"] == [{"email": data["data"][0]["email"]}]
+    assert data["next_cursor"] is not None
+
+# Bad Request: Unknown or private fields
+@pytest.mark.asyncio
+async def test_get_all_users_invalid_fields(test_client):
+    token = await create_user_and_get_token(test_client)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await test_client.get("/api/users/", headers=headers, params={"fields": "id,password_hash"})
+
+    assert response.status_code == 400
+    assert "password_hash" in response.json()["detail"]
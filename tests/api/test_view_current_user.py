@@ -86,3 +86,68 @@ async def test_get_current_user_token_missing_email(test_client, monkeypatch):
 
     assert response.status_code == 401
     assert data["detail"] == "Could not validate credentials"
+
+
+# Loaded principal is reused: /me must not touch the database again
+@pytest.mark.asyncio
+async def test_get_current_user_reuses_loaded_principal(test_client):
+    from datetime import datetime
+    from app.auth.jwt_handler import get_current_user  # same module instance the routes depend on
+    from app.auth.principal import Principal
+    from backend.app.main import app
+
+    principal = Principal(
+        id=42,
+        name="Loaded User",
+        email="loaded@example.com",
+        phone_no=1234567890,
+        created_at=datetime(2024, 1, 1),
+        updated_at=None,
+        jti="loaded-jti",
+        exp=0,
+    )
+    app.dependency_overrides[get_current_user] = lambda: principal
+    try:
+        response = await test_client.get("/api/users/me")
+    finally:
+        app.dependency_overrides.clear()
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["data"] == {
+        "id": 42,
+        "name": "Loaded User",
+        "email": "loaded@example.com",
+        "phone_no": 1234567890,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": None,
+    }
+
+# Projection: only the requested fields are returned, unknown ones are rejected
+@pytest.mark.asyncio
+async def test_get_current_user_fields(test_client):
+    from app.auth.jwt_handler import get_current_user  # same module instance the routes depend on
+    from app.auth.principal import Principal
+    from backend.app.main import app
+
+    principal = Principal(
+        id=42,
+        name="Loaded User",
+        email="loaded@example.com",
+        phone_no=None,
+        created_at=None,
+        updated_at=None,
+        jti="loaded-jti",
+        exp=0,
+    )
+    app.dependency_overrides[get_current_user] = lambda: principal
+    try:
+        response = await test_client.get("/api/users/me", params={"fields": "email,id"})
+        invalid = await test_client.get("/api/users/me", params={"fields": "email,jti"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"email": "loaded@example.com", "id": 42}
+    assert invalid.status_code == 400
+    assert "jti" in invalid.json()["detail"]
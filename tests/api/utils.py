@@ -53,3 +53,24 @@ async def create_user_and_get_token(test_client, email="testuser@example.com", p
         raise RuntimeError(f"Login succeeded but no token in response: {data}")
 
     return token
+
+
+def mock_write_session(rowcount=1):
+    """
+    AsyncSession stand-in for query-count tests; every statement goes through execute().
+    """
+    from unittest.mock import AsyncMock, MagicMock
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(rowcount=rowcount)
+    return session
+
+
+def make_principal(email="writer@example.com"):
+    from app.auth.principal import Principal  # same module instance the routes depend on
+
+    return Principal(
+        id=7, name="Writer", email=email, phone_no=None,
+        created_at=None, updated_at=None, jti="writer-jti", exp=0,
+    )
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import unittest
+from fastapi import HTTPException, status
+
+from backend.app.auth.hashing import HashingExecutor
+
+
+class TestHashingExecutor(unittest.IsolatedAsyncioTestCase):
+
+    async def test_run_returns_result(self):
+        executor = HashingExecutor(workers=1, max_queue=0)
+        try:
+            result = await executor.run(pow, 2, 10)
+            self.assertEqual(result, 1024)
+            self.assertEqual(executor.in_flight, 0)
+        finally:
+            executor.shutdown()
+
+    async def test_queue_full_raises_503(self):
+        executor = HashingExecutor(workers=1, max_queue=0)
+        release = threading.Event()
+        try:
+            busy = asyncio.create_task(executor.run(release.wait))
+            await asyncio.sleep(0)
+
+            with self.assertRaises(HTTPException) as context:
+                await executor.run(pow, 2, 10)
+
+            self.assertEqual(context.exception.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertEqual(context.exception.headers, {"Retry-After": "1"})
+
+            release.set()
+            await busy
+        finally:
+            release.set()
+            executor.shutdown()
+
+    async def test_event_loop_not_blocked(self):
+        executor = HashingExecutor(workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            busy = asyncio.create_task(executor.run(release.wait))
+            # The loop keeps serving other coroutines while the worker is busy
+            await asyncio.wait_for(asyncio.sleep(0.01), timeout=1)
+            self.assertFalse(busy.done())
+
+            release.set()
+            self.assertTrue(await busy)
+        finally:
+            release.set()
+            executor.shutdown()
+
+    async def test_cancelled_caller_keeps_job_counted(self):
+        executor = HashingExecutor(workers=1, max_queue=0)
+        release = threading.Event()
+        try:
+            busy = asyncio.create_task(executor.run(release.wait))
+            await asyncio.sleep(0.01)
+
+            # The client went away, but the worker is still hashing
+            busy.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await busy
+            self.assertEqual(executor.in_flight, 1)
+            with self.assertRaises(HTTPException):
+                await executor.run(pow, 2, 10)
+
+            release.set()
+            for _ in range(100):
+                if executor.in_flight == 0:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(executor.in_flight, 0)
+            self.assertEqual(await executor.run(pow, 2, 10), 1024)
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            HashingExecutor(kind="fiber")
@@ -1,18 +1,28 @@
 import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import timedelta
 from uuid import uuid4, UUID
+from types import SimpleNamespace
 import os
 from sqlalchemy import delete
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
 
 from backend.app.auth import jwt_handler
 from backend.app.utils.validation import get_current_utc_time
 from backend.app.models.jti_blacklist import JTIBlacklist
+from backend.app.models.user import User
 from backend.app.db.database import AsyncSessionLocal, engine
 
 SECRET_KEY = os.getenv("SECRET_KEY", "testsecretkey")
 ALGORITHM = "HS256"
 
 
+def _request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
 class TestJWTHandler(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         # Ensure engine is disposed after each test (avoids lingering tasks)
@@ -43,6 +53,29 @@ class TestJWTHandler(unittest.IsolatedAsyncioTestCase):
         expected_exp = (await get_current_utc_time()).timestamp() + 300
         self.assertTrue(abs(decoded["exp"] - expected_exp) < 60)
 
+    async def test_jittered_stays_within_bounds(self):
+        delta = timedelta(minutes=15)
+        for _ in range(100):
+            jittered = jwt_handler.jittered(delta)
+            self.assertLessEqual(abs(jittered.total_seconds() - 900), 900 * 0.1 + 1e-6)
+
+    async def test_create_token_pair(self):
+        access_token, refresh_token = await jwt_handler.create_token_pair("pair@test.com", 2, 5)
+
+        access = await jwt_handler.decode_access_token(access_token)
+        refresh = await jwt_handler.decode_access_token(refresh_token)
+
+        self.assertNotIn("type", access)
+        self.assertEqual(refresh["type"], jwt_handler.REFRESH_TOKEN_TYPE)
+        self.assertEqual(access["ver"], 2)
+        self.assertEqual(access["sub"], "5")
+        self.assertEqual(refresh["sub"], "5")
+        self.assertEqual(refresh["ver"], 2)
+        self.assertGreater(refresh["exp"], access["exp"])
+        # The access token names its refresh token so logout can revoke both
+        self.assertEqual(access["rjti"], refresh["jti"])
+        self.assertNotEqual(access["jti"], refresh["jti"])
+
     async def test_decode_invalid_token(self):
         invalid_token = "this.is.not.valid"
         decoded = await jwt_handler.decode_access_token(invalid_token)
@@ -69,3 +102,191 @@ class TestJWTHandler(unittest.IsolatedAsyncioTestCase):
             # Cleanup
             await db.execute(delete(JTIBlacklist).where(JTIBlacklist.jti == jti))
             await db.commit()
+
+    async def test_is_token_blacklisted_uses_cache(self):
+        jti = str(uuid4())
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_db.execute.return_value = mock_result
+
+        self.assertFalse(await jwt_handler.is_token_blacklisted(jti, mock_db))
+        self.assertFalse(await jwt_handler.is_token_blacklisted(jti, mock_db))
+        mock_db.execute.assert_awaited_once()
+
+        # Logout flips the cached answer without another query
+        exp = (await get_current_utc_time()).timestamp() + 60
+        jwt_handler.cache_token_revocation(jti, True, exp)
+        self.assertTrue(await jwt_handler.is_token_blacklisted(jti, mock_db))
+        mock_db.execute.assert_awaited_once()
+
+    async def test_decode_access_token_uses_cache(self):
+        jwt_handler.token_cache.clear()
+        token = await jwt_handler.create_access_token({"email": "cache@example.com"})
+
+        first = await jwt_handler.decode_access_token(token)
+        second = await jwt_handler.decode_access_token(token)
+
+        self.assertEqual(first, second)
+        self.assertEqual(jwt_handler.token_cache.stats()["misses"], 1)
+        self.assertEqual(jwt_handler.token_cache.stats()["hits"], 1)
+
+        # Callers get their own copy of the cached claims
+        second["email"] = "changed@example.com"
+        third = await jwt_handler.decode_access_token(token)
+        self.assertEqual(third["email"], "cache@example.com")
+
+    async def test_invalid_token_not_cached(self):
+        jwt_handler.token_cache.clear()
+        self.assertIsNone(await jwt_handler.decode_access_token("this.is.not.valid"))
+        self.assertEqual(len(jwt_handler.token_cache), 0)
+
+
+class TestGetCurrentUserQueryCount(unittest.IsolatedAsyncioTestCase):
+
+    async def _current_user(self, token, db):
+        request = _request()
+        payload = await jwt_handler.get_token_payload(request, token)
+        return await jwt_handler.get_current_user(request, payload=payload, db=db)
+
+    def _mock_db(self, user, revoked=False):
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        # Core row carrying the principal columns, as the user repository returns them
+        make_row = result_tuple(["id", "name", "email", "phone_no", "created_at", "updated_at", "token_version", "revoked"])
+        mock_result.one_or_none.return_value = make_row((
+            user.id, user.name, user.email, user.phone_no,
+            user.created_at, user.updated_at, user.token_version, revoked,
+        )) if user else None
+        mock_db.execute.return_value = mock_result
+        return mock_db
+
+    async def test_one_query_per_request(self):
+        user = User(id=1, name="Test", email="count@example.com", password_hash="hash", token_version=0)
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 0})
+
+        mock_db = self._mock_db(user)
+        current_user = await self._current_user(token, mock_db)
+        self.assertEqual(current_user.email, user.email)
+        self.assertEqual(mock_db.execute.await_count, 1)
+
+        # Revocation state is now cached; only the user lookup remains
+        mock_db = self._mock_db(user)
+        await self._current_user(token, mock_db)
+        self.assertEqual(mock_db.execute.await_count, 1)
+
+    async def test_one_cache_lookup_per_request(self):
+        user = User(id=1, name="Test", email="lookups@example.com", password_hash="hash", token_version=0)
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 0})
+
+        with patch.object(jwt_handler.blacklist_cache, "get", wraps=jwt_handler.blacklist_cache.get) as lookup:
+            await self._current_user(token, self._mock_db(user))
+            self.assertEqual(lookup.call_count, 1)
+
+            # The cached answer is reused too, not looked up again
+            lookup.reset_mock()
+            await self._current_user(token, self._mock_db(user))
+            self.assertEqual(lookup.call_count, 1)
+
+    async def test_connection_released_after_lookup(self):
+        user = User(id=1, name="Test", email="release@example.com", password_hash="hash", token_version=0)
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 0})
+
+        mock_db = self._mock_db(user)
+        await self._current_user(token, mock_db)
+        mock_db.close.assert_awaited_once()
+
+    async def test_revoked_token_rejected_in_single_query(self):
+        user = User(id=1, name="Test", email="revoked-count@example.com", password_hash="hash", token_version=0)
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 0})
+
+        mock_db = self._mock_db(user, revoked=True)
+        with self.assertRaises(HTTPException) as context:
+            await self._current_user(token, mock_db)
+        self.assertEqual(context.exception.detail, "Token has been revoked")
+        self.assertEqual(mock_db.execute.await_count, 1)
+
+        # A cached revocation needs no query at all
+        mock_db = self._mock_db(user)
+        with self.assertRaises(HTTPException):
+            await self._current_user(token, mock_db)
+        mock_db.execute.assert_not_awaited()
+
+    async def test_missing_user_single_query(self):
+        token = await jwt_handler.create_access_token({"email": "ghost@example.com"})
+
+        mock_db = self._mock_db(None)
+        with self.assertRaises(HTTPException) as context:
+            await self._current_user(token, mock_db)
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(mock_db.execute.await_count, 1)
+
+    async def test_missing_user_does_not_cache_revocation(self):
+        token = await jwt_handler.create_access_token({"email": "ghost-cache@example.com"})
+        jti = (await jwt_handler.decode_access_token(token))["jti"]
+
+        with self.assertRaises(HTTPException):
+            await self._current_user(token, self._mock_db(None))
+        self.assertIsNone(jwt_handler.blacklist_cache.get(jti))
+
+    async def test_stale_token_version_rejected(self):
+        user = User(id=1, name="Test", email="version@example.com", password_hash="hash", token_version=3)
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 2})
+
+        with self.assertRaises(HTTPException) as context:
+            await self._current_user(token, self._mock_db(user))
+        self.assertEqual(context.exception.status_code, 401)
+        self.assertEqual(context.exception.detail, "Token has been revoked")
+
+        token = await jwt_handler.create_access_token({"sub": "1", "email": user.email, "ver": 3})
+        current_user = await self._current_user(token, self._mock_db(user))
+        self.assertEqual(current_user.email, user.email)
+
+    async def test_token_for_deleted_account_rejected(self):
+        # Same email and token_version, but the row was deleted and re-created with a new id
+        user = User(id=2, name="Test", email="recreated@example.com", password_hash="hash", token_version=0)
+
+        for claims in ({"sub": "1", "email": user.email, "ver": 0}, {"email": user.email, "ver": 0}):
+            token = await jwt_handler.create_access_token(claims)
+            with self.assertRaises(HTTPException) as context:
+                await self._current_user(token, self._mock_db(user))
+            self.assertEqual(context.exception.status_code, 401)
+            self.assertEqual(context.exception.detail, "Token has been revoked")
+
+    async def test_principal_carries_refresh_jti(self):
+        user = User(id=1, name="Test", email="pair-principal@example.com", password_hash="hash", token_version=0)
+        access_token, refresh_token = await jwt_handler.create_token_pair(user.email, 0, user.id)
+
+        current_user = await self._current_user(access_token, self._mock_db(user))
+        refresh = await jwt_handler.decode_access_token(refresh_token)
+        self.assertEqual(current_user.refresh_jti, refresh["jti"])
+
+
+class TestGetTokenPayload(unittest.IsolatedAsyncioTestCase):
+
+    async def test_valid_token(self):
+        token = await jwt_handler.create_access_token({"email": "payload@example.com"})
+        request = _request()
+        payload = await jwt_handler.get_token_payload(request, token)
+        self.assertEqual(payload["email"], "payload@example.com")
+        self.assertEqual(request.state.principal_email, "payload@example.com")
+
+    async def test_invalid_token(self):
+        with self.assertRaises(HTTPException) as context:
+            await jwt_handler.get_token_payload(_request(), "this.is.not.valid")
+        self.assertEqual(context.exception.detail, "Could not validate credentials")
+
+    async def test_expired_token(self):
+        token = await jwt_handler.create_access_token({"email": "expired@example.com"}, timedelta(seconds=-1))
+        with self.assertRaises(HTTPException) as context:
+            await jwt_handler.get_token_payload(_request(), token)
+        self.assertEqual(context.exception.status_code, 401)
+
+    async def test_cached_revocation_rejected(self):
+        token = await jwt_handler.create_access_token({"email": "revoked-payload@example.com"})
+        payload = await jwt_handler.decode_access_token(token)
+        jwt_handler.cache_token_revocation(payload["jti"], True, payload["exp"])
+
+        with self.assertRaises(HTTPException) as context:
+            await jwt_handler.get_token_payload(_request(), token)
+        self.assertEqual(context.exception.detail, "Token has been revoked")
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime
+from sqlalchemy.engine.result import result_tuple
+
+from backend.app.auth.principal import Principal
+
+
+class TestPrincipal(unittest.TestCase):
+
+    def setUp(self):
+        # A Core row of PRINCIPAL_COLUMNS, as the user repository returns it
+        make_row = result_tuple(["id", "name", "email", "phone_no", "created_at", "updated_at", "token_version"])
+        self.row = make_row((1, "Test", "test@example.com", 1234567890, datetime(2024, 1, 1), None, 0))
+
+    def test_from_row(self):
+        principal = Principal.from_row(self.row, jti="some-jti", exp=1700000000)
+
+        self.assertEqual(principal.id, 1)
+        self.assertEqual(principal.email, "test@example.com")
+        self.assertEqual(principal.phone_no, 1234567890)
+        self.assertEqual(principal.jti, "some-jti")
+        self.assertEqual(principal.exp, 1700000000)
+        self.assertIsNone(principal.updated_at)
+        self.assertIsNone(principal.refresh_jti)
+
+    def test_excludes_password_hash_and_orm_state(self):
+        principal = Principal.from_row(self.row, jti="some-jti", exp=1700000000)
+
+        self.assertFalse(hasattr(principal, "password_hash"))
+        self.assertFalse(hasattr(principal, "_sa_instance_state"))
+        self.assertFalse(hasattr(principal, "__dict__"))
+
+    def test_is_immutable(self):
+        principal = Principal.from_row(self.row, jti="some-jti", exp=1700000000)
+
+        with self.assertRaises(AttributeError):
+            principal.email = "other@example.com"
@@ -1,20 +1,25 @@
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
+from types import SimpleNamespace
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.auth.user import get_user
-from backend.app.models.user import User
+from backend.app.auth.user import get_user, get_user_with_revocation
+
+
+def _row(revoked=False, **values):
+    # Stand-in for the Core row the user repository returns
+    return SimpleNamespace(token_version=0, revoked=revoked, **values)
 
 
 class TestGetUser(unittest.IsolatedAsyncioTestCase):
 
     async def test_user_found(self):
         mock_db = AsyncMock(spec=AsyncSession)
-        mock_user = User(id=1, name="Test", email="test@example.com", password_hash="hash")
+        mock_user = _row(id=1, name="Test", email="test@example.com")
 
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_result.one_or_none.return_value = mock_user
         mock_db.execute.return_value = mock_result
 
         result = await get_user("test@example.com", db=mock_db)
@@ -23,7 +28,7 @@ class TestGetUser(unittest.IsolatedAsyncioTestCase):
     async def test_user_not_found(self):
         mock_db = AsyncMock(spec=AsyncSession)
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.one_or_none.return_value = None
         mock_db.execute.return_value = mock_result
 
         with self.assertRaises(HTTPException) as context:
@@ -43,3 +48,40 @@ class TestGetUser(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(context.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertEqual(context.exception.detail, "Internal Server Error")
         mock_logger.error.assert_called_once()
+
+
+class TestGetUserWithRevocation(unittest.IsolatedAsyncioTestCase):
+
+    async def test_user_and_revocation_in_one_query(self):
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_user = _row(revoked=1, id=1, name="Test", email="test@example.com")
+
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = mock_user
+        mock_db.execute.return_value = mock_result
+
+        user, revoked = await get_user_with_revocation("test@example.com", "some-jti", db=mock_db)
+        self.assertEqual(user, mock_user)
+        self.assertTrue(revoked)
+        mock_db.execute.assert_awaited_once()
+
+    async def test_user_not_found(self):
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_db.execute.return_value = mock_result
+
+        user, revoked = await get_user_with_revocation("notfound@example.com", "some-jti", db=mock_db)
+        self.assertIsNone(user)
+        self.assertFalse(revoked)
+
+    @patch("backend.app.auth.user.logger")
+    async def test_db_error_raises_500(self, mock_logger):
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_db.execute.side_effect = Exception("DB Error")
+
+        with self.assertRaises(HTTPException) as context:
+            await get_user_with_revocation("error@example.com", "some-jti", db=mock_db)
+
+        self.assertEqual(context.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        mock_logger.error.assert_called_once()
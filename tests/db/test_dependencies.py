@@ -1,5 +1,8 @@
 import unittest
-from backend.app.db.dependencies import get_db
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from backend.app.db import dependencies
+from backend.app.db.dependencies import get_db, get_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from types import AsyncGeneratorType
 
@@ -34,3 +37,52 @@ class TestGetDbDependency(unittest.IsolatedAsyncioTestCase):
         await gen.aclose()
 
         self.assertTrue(session_closed_flag["closed"])
+
+
+class TestGetReadDbDependency(unittest.IsolatedAsyncioTestCase):
+
+    def _request(self, email=None, cookies=None):
+        return SimpleNamespace(state=SimpleNamespace(principal_email=email), cookies=cookies or {})
+
+    async def test_reads_use_read_session(self):
+        primary = MagicMock()
+        read_session = AsyncSession()
+
+        # Without a replica the read pool points at the primary, so even a recent writer uses it
+        with patch.object(dependencies, "AsyncReadSessionLocal", return_value=read_session), \
+             patch.object(dependencies, "is_pinned_to_primary", return_value=True):
+            gen = get_read_db(self._request("writer@example.com"), db=primary)
+            self.assertIs(await anext(gen), read_session)
+            await gen.aclose()
+
+    async def test_with_replica_uses_read_session(self):
+        primary = MagicMock()
+        replica_session = AsyncSession()
+
+        with patch.object(dependencies.settings, "MYSQL_REPLICA_HOST", "replica"), \
+             patch.object(dependencies, "AsyncReadSessionLocal", return_value=replica_session):
+            gen = get_read_db(self._request("reader@example.com"), db=primary)
+            self.assertIs(await anext(gen), replica_session)
+            await gen.aclose()
+
+    async def test_recent_writer_stays_on_primary(self):
+        primary = MagicMock()
+
+        with patch.object(dependencies.settings, "MYSQL_REPLICA_HOST", "replica"), \
+             patch.object(dependencies, "is_pinned_to_primary", return_value=True):
+            gen = get_read_db(self._request("writer@example.com"), db=primary)
+            self.assertIs(await anext(gen), primary)
+            await gen.aclose()
+
+    async def test_pin_cookie_from_another_worker_stays_on_primary(self):
+        import time
+        from backend.app.db import routing
+
+        primary = MagicMock()
+        routing._recent_writers.clear()
+        cookies = {routing.PIN_COOKIE: routing.sign_pin("writer@example.com", int(time.time()) + 5)}
+
+        with patch.object(dependencies.settings, "MYSQL_REPLICA_HOST", "replica"):
+            gen = get_read_db(self._request("writer@example.com", cookies), db=primary)
+            self.assertIs(await anext(gen), primary)
+            await gen.aclose()
@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.app.db import health
+from backend.app.db.health import ConnectionHealthMonitor, CachedHealthCheck
+
+
+def _mock_engine(*identities):
+    """Engine whose probe returns the given server identities in turn (an Exception raises)."""
+    conn = AsyncMock()
+    results = []
+    for identity in identities:
+        if isinstance(identity, Exception):
+            results.append(identity)
+        else:
+            result = MagicMock()
+            result.one.return_value = identity
+            results.append(result)
+    conn.execute.side_effect = results
+
+    conn_ctx = MagicMock()
+    conn_ctx.__aenter__ = AsyncMock(return_value=conn)
+    conn_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    engine = MagicMock()
+    engine.connect.return_value = conn_ctx
+    engine.dispose = AsyncMock()
+    return engine
+
+
+class TestConnectionHealthMonitor(unittest.IsolatedAsyncioTestCase):
+
+    async def test_healthy_check(self):
+        engine = _mock_engine((1, "db"), (1, "db"))
+        monitor = ConnectionHealthMonitor(engine)
+
+        self.assertTrue(await monitor.check_once())
+        self.assertTrue(await monitor.check_once())
+
+        self.assertTrue(monitor.healthy)
+        self.assertEqual(monitor.stats()["checks"], 2)
+        engine.dispose.assert_not_awaited()
+
+    async def test_failed_check_invalidates_pool(self):
+        engine = _mock_engine(ConnectionError("server has gone away"))
+        monitor = ConnectionHealthMonitor(engine)
+
+        self.assertFalse(await monitor.check_once())
+
+        self.assertFalse(monitor.healthy)
+        self.assertEqual(monitor.failures, 1)
+        self.assertIn("gone away", monitor.last_error)
+        engine.dispose.assert_awaited_once()
+
+    async def test_failover_invalidates_pool(self):
+        engine = _mock_engine((1, "primary"), (2, "replica"))
+        monitor = ConnectionHealthMonitor(engine)
+
+        await monitor.check_once()
+        await monitor.check_once()
+
+        self.assertEqual(monitor.failovers, 1)
+        self.assertEqual(monitor.server_identity, (2, "replica"))
+        engine.dispose.assert_awaited_once()
+
+    async def test_start_disabled_when_interval_is_zero(self):
+        monitor = ConnectionHealthMonitor(_mock_engine(), interval=0)
+        monitor.start()
+        self.assertIsNone(monitor._task)
+        await monitor.stop()
+
+
+class TestCachedHealthCheck(unittest.IsolatedAsyncioTestCase):
+
+    async def test_result_cached_within_ttl(self):
+        engine = _mock_engine((1, "db"))
+        check = CachedHealthCheck(engine, ttl=60)
+
+        self.assertTrue(await check.check())
+        self.assertTrue(await check.check())
+        self.assertEqual(check.probes, 1)
+        engine.connect.assert_called_once()
+
+    async def test_rechecks_after_ttl(self):
+        engine = _mock_engine((1, "db"), Exception("gone away"))
+        check = CachedHealthCheck(engine, ttl=5)
+
+        with patch.object(health.time, "monotonic", return_value=100.0):
+            self.assertTrue(await check.check())
+        with patch.object(health.time, "monotonic", return_value=106.0):
+            self.assertFalse(await check.check())
+        self.assertEqual(check.probes, 2)
+
+    async def test_concurrent_probes_share_one_check(self):
+        engine = _mock_engine((1, "db"))
+        check = CachedHealthCheck(engine, ttl=60)
+
+        results = await asyncio.gather(*(check.check() for _ in range(10)))
+        self.assertEqual(results, [True] * 10)
+        self.assertEqual(check.probes, 1)
+
+    async def test_slow_database_times_out(self):
+        engine = _mock_engine((1, "db"))
+        check = CachedHealthCheck(engine, ttl=60, timeout=0.01)
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        engine.connect.return_value.__aenter__.return_value.execute.side_effect = hang
+        self.assertFalse(await check.check())
+
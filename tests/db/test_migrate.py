@@ -0,0 +1,133 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.exc import ProgrammingError
+
+from backend.app.db import migrate
+from backend.app.db.migrations import MIGRATIONS, LATEST_VERSION, v0002_jti_expires_at
+
+
+def _result(value):
+    result = MagicMock()
+    result.scalar.return_value = value
+    return result
+
+
+class FakeConnection:
+    """
+    Records every statement; answers GET_LOCK and the version query.
+    """
+
+    def __init__(self, version=0, lock=1, existing=0):
+        self.version = version
+        self.lock = lock
+        self.existing = existing
+        self.statements = []
+        self.commit = AsyncMock()
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "GET_LOCK" in sql:
+            return _result(self.lock)
+        if "MAX(version)" in sql:
+            return _result(self.version)
+        if "information_schema" in sql:
+            return _result(self.existing)
+        return _result(None)
+
+    def sql(self, fragment):
+        return [sql for sql in self.statements if fragment in sql]
+
+
+def _engine(conn):
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__.return_value = conn
+    return engine
+
+
+class TestMigrate(unittest.IsolatedAsyncioTestCase):
+
+    async def test_applies_pending_migrations_in_order(self):
+        conn = FakeConnection(version=1)
+
+        applied = await migrate.migrate(_engine(conn))
+
+        self.assertEqual(applied, [m.VERSION for m in MIGRATIONS if m.VERSION > 1])
+        self.assertIn("GET_LOCK", conn.statements[0])
+        self.assertIn("RELEASE_LOCK", conn.statements[-1])
+        self.assertEqual(len(conn.sql("INSERT INTO schema_version")), len(applied))
+        self.assertEqual(conn.sql("CREATE TABLE IF NOT EXISTS users"), [])
+
+    async def test_up_to_date_runs_no_ddl(self):
+        conn = FakeConnection(version=LATEST_VERSION)
+
+        self.assertEqual(await migrate.migrate(_engine(conn)), [])
+        self.assertEqual(conn.sql("ALTER TABLE"), [])
+        self.assertEqual(conn.sql("INSERT INTO schema_version"), [])
+
+    async def test_lock_timeout(self):
+        conn = FakeConnection(lock=0)
+
+        with self.assertRaises(RuntimeError):
+            await migrate.migrate(_engine(conn))
+        self.assertEqual(len(conn.statements), 1)
+
+    async def test_lock_released_when_migration_fails(self):
+        conn = FakeConnection(version=0)
+
+        with patch.object(MIGRATIONS[0], "upgrade", AsyncMock(side_effect=Exception("DDL failed"))):
+            with self.assertRaises(Exception):
+                await migrate.migrate(_engine(conn))
+
+        self.assertIn("RELEASE_LOCK", conn.statements[-1])
+        self.assertEqual(conn.sql("INSERT INTO schema_version"), [])
+
+    async def test_migrations_skip_existing_columns(self):
+        # Databases built by create_all already have the columns
+        conn = FakeConnection(existing=1)
+        await v0002_jti_expires_at.upgrade(conn)
+        self.assertEqual(conn.sql("ALTER TABLE"), [])
+        self.assertEqual(conn.sql("CREATE INDEX"), [])
+
+        conn = FakeConnection(existing=0)
+        await v0002_jti_expires_at.upgrade(conn)
+        self.assertEqual(len(conn.sql("ALTER TABLE")), 1)
+        self.assertEqual(len(conn.sql("CREATE INDEX")), 1)
+
+    def test_versions_are_sequential(self):
+        self.assertEqual([m.VERSION for m in MIGRATIONS], list(range(1, len(MIGRATIONS) + 1)))
+
+
+class TestSchemaVersionCheck(unittest.IsolatedAsyncioTestCase):
+
+    async def test_current_schema(self):
+        conn = FakeConnection(version=LATEST_VERSION)
+        self.assertEqual(await migrate.check_schema_version(_engine(conn)), LATEST_VERSION)
+        self.assertEqual(len(conn.statements), 1)
+
+    async def test_outdated_schema_refuses_to_start(self):
+        conn = FakeConnection(version=LATEST_VERSION - 1)
+        with self.assertRaises(RuntimeError) as context:
+            await migrate.check_schema_version(_engine(conn))
+        self.assertIn("python -m app.db.migrate", str(context.exception))
+
+    async def test_missing_version_table_is_version_zero(self):
+        conn = AsyncMock()
+        conn.execute.side_effect = ProgrammingError("SELECT", {}, SimpleNamespace(args=(1146, "no such table")))
+        self.assertEqual(await migrate.get_schema_version(conn), 0)
+
+        conn.execute.side_effect = ProgrammingError("SELECT", {}, SimpleNamespace(args=(1064, "syntax error")))
+        with self.assertRaises(ProgrammingError):
+            await migrate.get_schema_version(conn)
+
+
+class TestMigrateDatabase(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await migrate.engine.dispose()
+
+    async def test_migrate_is_idempotent(self):
+        await migrate.migrate()
+        self.assertEqual(await migrate.migrate(), [])
+        self.assertEqual(await migrate.check_schema_version(), LATEST_VERSION)
@@ -0,0 +1,98 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from backend.app.db import routing
+
+
+class TestReadYourWrites(unittest.TestCase):
+
+    def setUp(self):
+        routing._recent_writers.clear()
+
+    def test_unknown_user_reads_from_replica(self):
+        self.assertFalse(routing.is_pinned_to_primary("reader@example.com"))
+        self.assertFalse(routing.is_pinned_to_primary(None))
+
+    def test_writer_pinned_to_primary(self):
+        routing.mark_write("writer@example.com")
+        self.assertTrue(routing.is_pinned_to_primary("writer@example.com"))
+        self.assertFalse(routing.is_pinned_to_primary("other@example.com"))
+
+    def test_pin_expires_after_window(self):
+        routing.mark_write("writer@example.com")
+
+        later = time.time() + routing.settings.READ_YOUR_WRITES_SECONDS + 1
+        with patch("backend.app.utils.cache.time.time", return_value=later):
+            self.assertFalse(routing.is_pinned_to_primary("writer@example.com"))
+
+    @patch.object(routing.settings, "READ_YOUR_WRITES_SECONDS", 0)
+    def test_window_disabled(self):
+        routing.mark_write("writer@example.com")
+        self.assertFalse(routing.is_pinned_to_primary("writer@example.com"))
+
+
+class TestPinCookie(unittest.TestCase):
+
+    def setUp(self):
+        routing._recent_writers.clear()
+
+    def test_cookie_pins_on_another_worker(self):
+        # Nothing in this process's cache, as on a worker that did not see the write
+        value = routing.sign_pin("writer@example.com", int(time.time()) + 5)
+        self.assertTrue(routing.is_pinned_to_primary("writer@example.com", value))
+
+    def test_cookie_is_bound_to_user(self):
+        value = routing.sign_pin("writer@example.com", int(time.time()) + 5)
+        self.assertFalse(routing.is_pinned_to_primary("other@example.com", value))
+
+    def test_expired_or_forged_cookie_ignored(self):
+        until = int(time.time()) + 5
+        self.assertFalse(routing.pin_cookie_valid("writer@example.com", routing.sign_pin("writer@example.com", until - 10)))
+        self.assertFalse(routing.pin_cookie_valid("writer@example.com", f"{until}.forged"))
+        self.assertFalse(routing.pin_cookie_valid("writer@example.com", "garbage"))
+        self.assertFalse(routing.pin_cookie_valid("writer@example.com", None))
+
+
+class TestReadYourWritesMiddleware(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        routing._recent_writers.clear()
+
+    def _app(self):
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.add_middleware(routing.ReadYourWritesMiddleware)
+
+        @app.post("/write")
+        async def write():
+            routing.mark_write("writer@example.com")
+            return {}
+
+        @app.get("/read")
+        async def read():
+            return {}
+
+        return app
+
+    async def test_write_sets_pin_cookie(self):
+        from httpx import ASGITransport, AsyncClient
+
+        async with AsyncClient(transport=ASGITransport(app=self._app()), base_url="http://test") as client:
+            self.assertNotIn("set-cookie", (await client.get("/read")).headers)
+
+            response = await client.post("/write")
+            value = response.cookies[routing.PIN_COOKIE]
+            self.assertIn("HttpOnly", response.headers["set-cookie"])
+
+        # A second worker has an empty cache but still honours the cookie
+        routing._recent_writers.clear()
+        self.assertTrue(routing.is_pinned_to_primary("writer@example.com", value))
+
+    @patch.object(routing.settings, "READ_YOUR_WRITES_SECONDS", 0)
+    async def test_no_cookie_when_window_disabled(self):
+        from httpx import ASGITransport, AsyncClient
+
+        async with AsyncClient(transport=ASGITransport(app=self._app()), base_url="http://test") as client:
+            self.assertNotIn("set-cookie", (await client.post("/write")).headers)
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.db.database import engine
+from backend.app.db.user_repository import UserRepository
+from backend.app.models.user import User
+
+
+class TestUserRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.repository = UserRepository()
+        self.db = AsyncMock(spec=AsyncSession)
+        self.result = MagicMock()
+        self.db.execute.return_value = self.result
+
+    def _sql(self, call=-1):
+        statement = self.db.execute.await_args_list[call].args[0]
+        return str(statement.compile(dialect=engine.dialect))
+
+    async def test_get_by_email_selects_principal_columns(self):
+        self.result.one_or_none.return_value = None
+        self.assertIsNone(await self.repository.get_by_email(self.db, "a@example.com"))
+
+        sql = self._sql()
+        self.assertIn("users.token_version", sql)
+        self.assertNotIn("password_hash", sql)
+
+    async def test_get_with_revocation(self):
+        self.result.one_or_none.return_value = MagicMock(revoked=1)
+        row, revoked = await self.repository.get_with_revocation(self.db, "a@example.com", "jti")
+        self.assertTrue(revoked)
+        self.assertIn("EXISTS", self._sql())
+
+        self.result.one_or_none.return_value = None
+        self.assertEqual(await self.repository.get_with_revocation(self.db, "b@example.com", "jti"), (None, False))
+
+    async def test_lambda_statement_binds_new_parameters(self):
+        self.result.one_or_none.return_value = None
+        await self.repository.get_credentials(self.db, "first@example.com")
+        await self.repository.get_credentials(self.db, "second@example.com")
+
+        first, second = (call.args[0].compile(dialect=engine.dialect) for call in self.db.execute.await_args_list)
+        self.assertEqual(str(first), str(second))
+        self.assertEqual(list(first.params.values()), ["first@example.com"])
+        self.assertEqual(list(second.params.values()), ["second@example.com"])
+
+    async def test_writes_return_rowcount(self):
+        self.result.rowcount = 1
+        self.assertEqual(await self.repository.update_profile(self.db, 1, {"name": "New"}), 1)
+        self.assertEqual(await self.repository.bump_token_version(self.db, 1), 1)
+        self.result.rowcount = 0
+        self.assertEqual(await self.repository.delete(self.db, 1), 0)
+        self.assertEqual(self.db.execute.await_count, 3)
+
+    async def test_list_page(self):
+        self.result.all.return_value = []
+        await self.repository.list_page(self.db, [User.id, User.email], after_id=10, limit=3)
+
+        sql = self._sql()
+        self.assertIn("users.id > ", sql)
+        self.assertIn("LIMIT", sql)
+
+    async def test_latency_recorded_per_query(self):
+        self.result.one_or_none.return_value = None
+        await self.repository.get_by_email(self.db, "a@example.com")
+        await self.repository.get_by_email(self.db, "a@example.com")
+
+        self.db.execute.side_effect = Exception("DB Error")
+        with self.assertRaises(Exception):
+            await self.repository.delete(self.db, 1)
+
+        stats = self.repository.stats()
+        self.assertEqual(stats["get_by_email"]["count"], 2)
+        self.assertEqual(stats["delete"]["count"], 1)
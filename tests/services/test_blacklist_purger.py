@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.app.services.blacklist_purger import BlacklistPurger
+
+
+def _mock_session_factory(rowcounts):
+    session = AsyncMock()
+    session.execute.side_effect = [MagicMock(rowcount=count) for count in rowcounts]
+
+    session_ctx = MagicMock()
+    session_ctx.__aenter__ = AsyncMock(return_value=session)
+    session_ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session_ctx), session
+
+
+class TestBlacklistPurger(unittest.IsolatedAsyncioTestCase):
+
+    async def test_purge_once_deletes_in_batches(self):
+        factory, session = _mock_session_factory([2, 2, 1])
+        purger = BlacklistPurger(batch_size=2)
+
+        with patch("backend.app.services.blacklist_purger.AsyncSessionLocal", factory):
+            purged = await purger.purge_once()
+
+        self.assertEqual(purged, 5)
+        self.assertEqual(session.execute.await_count, 3)
+        self.assertEqual(session.commit.await_count, 3)
+
+        stats = purger.stats()
+        self.assertEqual(stats["runs"], 1)
+        self.assertEqual(stats["rows_purged"], 5)
+        self.assertIsNotNone(stats["last_run_at"])
+        self.assertIsNone(stats["last_error"])
+
+    async def test_start_disabled_when_interval_is_zero(self):
+        purger = BlacklistPurger(interval=0)
+        purger.start()
+        self.assertIsNone(purger._task)
+        await purger.stop()
+
+    async def test_start_and_stop(self):
+        factory, _ = _mock_session_factory([0])
+        purger = BlacklistPurger(interval=3600)
+
+        with patch("backend.app.services.blacklist_purger.AsyncSessionLocal", factory):
+            purger.start()
+            self.assertIsNotNone(purger._task)
+            await purger.stop()
+
+        self.assertIsNone(purger._task)
@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.app.services import warmup as warmup_module
+from backend.app.services.warmup import Warmup, prewarm_pool, warm_validators
+
+
+def _engine(pool_size, fail_after=None):
+    engine = MagicMock()
+    engine.sync_engine.pool.size.return_value = pool_size
+    connections = []
+
+    def connect():
+        conn = MagicMock()
+        conn.close = AsyncMock()
+        if fail_after is not None and len(connections) >= fail_after:
+            conn.start = AsyncMock(side_effect=OSError("connection refused"))
+        else:
+            conn.start = AsyncMock(return_value=conn)
+        connections.append(conn)
+        return conn
+
+    engine.connect.side_effect = connect
+    return engine, connections
+
+
+class TestPrewarmPool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_opens_and_returns_connections(self):
+        engine, connections = _engine(pool_size=5)
+
+        self.assertEqual(await prewarm_pool(engine, 3), 3)
+        self.assertEqual(len(connections), 3)
+        for conn in connections:
+            conn.close.assert_awaited_once()
+
+    async def test_capped_at_pool_size(self):
+        engine, connections = _engine(pool_size=2)
+        self.assertEqual(await prewarm_pool(engine, 10), 2)
+
+    async def test_disabled(self):
+        engine, connections = _engine(pool_size=5)
+        self.assertEqual(await prewarm_pool(engine, 0), 0)
+        engine.connect.assert_not_called()
+
+    async def test_failure_returns_opened_connections(self):
+        engine, connections = _engine(pool_size=3, fail_after=2)
+
+        with self.assertRaises(OSError):
+            await prewarm_pool(engine, 3)
+        connections[0].close.assert_awaited_once()
+        connections[1].close.assert_awaited_once()
+
+
+class TestWarmup(unittest.IsolatedAsyncioTestCase):
+
+    def test_warm_validators(self):
+        warm_validators()
+
+    async def test_ready_after_run(self):
+        warmup = Warmup(pool_connections=2)
+        self.assertFalse(warmup.ready)
+
+        with patch.object(warmup_module, "prewarm_pool", AsyncMock(return_value=2)), \
+             patch.object(warmup_module, "warm_statements", AsyncMock()):
+            await warmup.run()
+
+        self.assertTrue(warmup.ready)
+        self.assertEqual(warmup.stats()["connections_opened"], 4)
+        self.assertEqual(warmup.stats()["errors"], [])
+
+    async def test_failed_step_does_not_block_readiness(self):
+        warmup = Warmup(pool_connections=2)
+
+        with patch.object(warmup_module, "prewarm_pool", AsyncMock(return_value=2)), \
+             patch.object(warmup_module, "warm_statements", AsyncMock(side_effect=Exception("compile failed"))):
+            await warmup.run()
+
+        self.assertTrue(warmup.ready)
+        self.assertFalse(warmup.degraded)
+        self.assertEqual(len(warmup.errors), 1)
+        self.assertIn("statements", warmup.errors[0])
+
+    async def test_failed_pool_starts_degraded(self):
+        warmup = Warmup(pool_connections=2)
+
+        with patch.object(warmup_module, "prewarm_pool", AsyncMock(side_effect=OSError("db down"))), \
+             patch.object(warmup_module, "warm_statements", AsyncMock()) as statements:
+            await warmup.run()
+
+        self.assertFalse(warmup.ready)
+        self.assertTrue(warmup.degraded)
+        self.assertIn("pool", warmup.errors[0])
+        statements.assert_awaited_once()
+
+        warmup.recovered()
+        self.assertTrue(warmup.ready)
+        self.assertFalse(warmup.stats()["degraded"])
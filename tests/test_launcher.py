@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+
+from backend.app import __main__ as launcher
+from backend.app.core.config import Settings
+
+
+class TestWorkerCount(unittest.TestCase):
+
+    def test_zero_means_one_per_core(self):
+        with patch.object(launcher, "cpu_count", return_value=6):
+            self.assertEqual(launcher.worker_count(0), 6)
+            self.assertEqual(launcher.worker_count(3), 3)
+
+    def test_negative_is_rejected(self):
+        with self.assertRaises(ValueError):
+            launcher.worker_count(-1)
+
+    def test_cpu_count_is_positive(self):
+        self.assertGreaterEqual(launcher.cpu_count(), 1)
+
+
+class TestUvicornOptions(unittest.TestCase):
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_defaults(self):
+        with patch.object(launcher, "cpu_count", return_value=4):
+            options = launcher.uvicorn_options(Settings())
+
+        self.assertEqual(options["app"], "app.main:app")
+        self.assertEqual(options["host"], "127.0.0.1")
+        self.assertEqual(options["port"], 8080)
+        self.assertEqual(options["workers"], 4)
+        self.assertEqual(options["loop"], "auto")
+        self.assertEqual(options["http"], "auto")
+        self.assertIsNone(options["limit_concurrency"])
+        self.assertIsNone(options["limit_max_requests"])
+
+    @patch.dict("os.environ", {
+        "HOST": "127.0.0.1",
+        "PORT": "9000",
+        "WORKERS": "2",
+        "LOOP": "uvloop",
+        "HTTP": "httptools",
+        "BACKLOG": "4096",
+        "KEEP_ALIVE": "20",
+        "LIMIT_CONCURRENCY": "500",
+        "LIMIT_MAX_REQUESTS": "100000",
+        "TIMEOUT_GRACEFUL_SHUTDOWN": "15",
+    }, clear=True)
+    def test_from_environment(self):
+        options = launcher.uvicorn_options(Settings())
+
+        self.assertEqual(options["host"], "127.0.0.1")
+        self.assertEqual(options["port"], 9000)
+        self.assertEqual(options["workers"], 2)
+        self.assertEqual(options["loop"], "uvloop")
+        self.assertEqual(options["http"], "httptools")
+        self.assertEqual(options["backlog"], 4096)
+        self.assertEqual(options["timeout_keep_alive"], 20)
+        self.assertEqual(options["limit_concurrency"], 500)
+        self.assertEqual(options["limit_max_requests"], 100000)
+        self.assertEqual(options["timeout_graceful_shutdown"], 15)
+
+    @patch.dict("os.environ", {"WORKERS": "1"}, clear=True)
+    def test_options_are_accepted_by_uvicorn(self):
+        options = launcher.uvicorn_options(Settings())
+        with patch.object(launcher.uvicorn, "run") as run:
+            with patch.object(launcher, "settings", Settings()):
+                launcher.main()
+        run.assert_called_once_with(**options)
+
+        # Every key must be a uvicorn.Config argument
+        config = launcher.uvicorn.Config(**options)
+        self.assertEqual(config.workers, 1)
@@ -0,0 +1,43 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from backend.app.utils.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, time.time() + 60)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_entry_expires(self):
+        cache = TTLCache()
+        now = time.time()
+        cache.set("a", 1, now + 10)
+
+        with patch("backend.app.utils.cache.time.time", return_value=now + 11):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_already_expired_entry_is_ignored(self):
+        cache = TTLCache()
+        cache.set("a", 1, time.time() - 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        expires_at = time.time() + 60
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a")
+        cache.set("c", 3, expires_at)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
@@ -0,0 +1,18 @@
+import unittest
+from backend.app.utils.pagination import encode_cursor, decode_cursor
+
+
+class TestPaginationCursor(unittest.TestCase):
+
+    def test_round_trip(self):
+        for last_id in (0, 1, 42, 2**40):
+            self.assertEqual(decode_cursor(encode_cursor(last_id)), last_id)
+
+    def test_cursor_is_opaque(self):
+        cursor = encode_cursor(42)
+        self.assertNotIn("42", cursor)
+        self.assertNotIn("=", cursor)
+
+    def test_malformed_cursor(self):
+        for cursor in ("", "!!!", "bm90LWFuLWlk", encode_cursor(-1)):
+            self.assertIsNone(decode_cursor(cursor))
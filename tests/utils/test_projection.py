@@ -0,0 +1,31 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from backend.app.utils.projection import USER_FIELDS, parse_fields, user_columns, project
+
+
+class TestProjection(unittest.TestCase):
+
+    def test_default_is_all_public_fields(self):
+        self.assertEqual(parse_fields(None), list(USER_FIELDS))
+        self.assertNotIn("password_hash", USER_FIELDS)
+        self.assertNotIn("token_version", USER_FIELDS)
+
+    def test_subset_keeps_order_and_drops_duplicates(self):
+        self.assertEqual(parse_fields(" email, id ,email"), ["email", "id"])
+
+    def test_invalid_fields(self):
+        for fields in ("password_hash", "id,unknown", "", " , "):
+            with self.assertRaises(ValueError):
+                parse_fields(fields)
+
+    def test_user_columns(self):
+        columns = user_columns(["id", "email"])
+        self.assertEqual([column.key for column in columns], ["id", "email"])
+
+    def test_project(self):
+        row = SimpleNamespace(id=1, email="row@example.com", created_at=datetime(2024, 1, 1), updated_at=None)
+        self.assertEqual(
+            project(row, ["email", "created_at", "updated_at"]),
+            {"email": "row@example.com", "created_at": "2024-01-01T00:00:00", "updated_at": None},
+        )